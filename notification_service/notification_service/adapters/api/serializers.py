@@ -12,4 +12,7 @@ class NotificationSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = models.NotificationModel
         fields = ["uuid", "user_uuid", "title", "text", "type"]
+        # Sending notification with existing UUID is idempotent and
+        # is resolved by the use case, not rejected on validation.
+        extra_kwargs = {"uuid": {"validators": []}}
 
@@ -11,7 +11,10 @@ from notification_service.adapters.api import serializers
 from notification_service.application.use_cases.send_notification import (
     SendNotificationUseCase
 )
-from notification_service.adapters.dependencies import get_unit_of_work
+from notification_service.adapters.dependencies import (
+    get_unit_of_work,
+    get_notification_dispatcher
+)
 
 
 class SendNotificationView(APIView):
@@ -28,29 +31,33 @@ class SendNotificationView(APIView):
 
     def post(self, request: Request) -> Response:
         logger.debug("Received POST request to send notification")
-        logger.debug(f"Request data: {request.data}")
+        logger.debug("Request data: {}", request.data)
         
         notification_data = self.serializer_class(data=request.data)
         notification_data.is_valid(raise_exception=True)
         logger.debug(
-            f"Validated notification data: "
-            f"{notification_data.validated_data}"
+            "Validated notification data: {}",
+            notification_data.validated_data
         )
         
-        use_case = SendNotificationUseCase(get_unit_of_work())        
+        use_case = SendNotificationUseCase(
+            get_unit_of_work(),
+            get_notification_dispatcher()
+        )
         notification = Notification(**notification_data.validated_data)
         logger.debug(
-            f"Created notification object with UUID: {notification.uuid}"
+            "Created notification object with UUID: {}",
+            notification.uuid
         )
         
         accept_status = use_case.execute(notification)
-        logger.debug(f"Use case executed, status: {accept_status}")
+        logger.debug("Use case executed, status: {}", accept_status)
         
         response_data = asdict(accept_status)
-        logger.debug(f"Returning response data: {response_data}")
+        logger.debug("Returning response data: {}", response_data)
         
         status_code = 201 if accept_status.was_created else 200
-        logger.debug(f"Response status code: {status_code}")
+        logger.debug("Response status code: {}", status_code)
         
         return Response(
             response_data,
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-14 14:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0002_added_indexes_to_notifications"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notificationmodel",
+            name="uuid",
+            field=models.UUIDField(unique=True),
+        ),
+    ]
@@ -25,7 +25,7 @@ class NotificationModel(models.Model):
     Stores notification information in the database.
     """
 
-    uuid: UUID = models.UUIDField(db_index=True)
+    uuid: UUID = models.UUIDField(unique=True)
     user_uuid: UUID = models.UUIDField()
     title: str = models.CharField()
     text: str = models.CharField()
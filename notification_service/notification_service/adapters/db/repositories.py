@@ -57,7 +57,9 @@ class DjangoNotificationRepository(NotificationRepositoryPort):
             If notification is not found
         """
         logger.debug(f"Fetching notification by UUID: {uuid}")
-        obj = NotificationModel.objects.filter(uuid=uuid).first()
+        # Slicing instead of .first(), which would add ORDER BY id
+        # and may force the planner to walk the primary key index.
+        obj = next(iter(NotificationModel.objects.filter(uuid=uuid)[:1]), None)
         if not obj:
             logger.warning(f"Notification with UUID {uuid} not found")
             raise ObjectNotFoundInRepository()
@@ -91,6 +93,39 @@ class DjangoNotificationRepository(NotificationRepositoryPort):
         logger.debug(f"Created notification: {result}")
         return result
 
+    def create_or_get(
+            self,
+            notification: Notification
+    ) -> tuple[Notification, bool]:
+        """
+        Create a new notification or get the existing one with the same UUID.
+        Existing notification is fetched with a single query.
+
+        Parameters
+        ----------
+        notification : Notification
+            Notification object to create
+
+        Returns
+        ----------
+        tuple[Notification, bool]
+            Stored notification object and True if it was created,
+            False if it already existed.
+        """
+        logger.debug(f"Creating or getting notification: {notification.uuid}")
+        notification_model, created = NotificationModel.objects.get_or_create(
+            uuid=notification.uuid,
+            defaults=dict(
+                user_uuid=notification.user_uuid,
+                title=notification.title,
+                text=notification.text,
+                type=notification.type,
+            )
+        )
+        result = self._model_to_entity(notification_model)
+        logger.debug(f"Notification {result.uuid} was created: {created}")
+        return result, created
+
     def update(self, notification: Notification) -> Notification:
         """
         Update an existing notification.
@@ -131,24 +166,34 @@ class DjangoNotificationRepository(NotificationRepositoryPort):
         logger.debug(f"Updated notification: {notification}")
         return notification
 
-    def get_pending_for_update(self) -> Notification | None:
+    def get_pending_for_update(
+            self,
+            uuid: UUID | None = None
+    ) -> Notification | None:
         """
         Get pending notification for update,
         locking a row while transaction is alive.
 
+        Parameters
+        ----------
+        uuid : UUID | None
+            UUID of the notification to get.
+            If None, the oldest pending notification is returned.
+
         Returns
         ----------
         Notification | None
             Notification object or None, if there are no pending notifications 
         """
         logger.debug("Fetching pending notification for update")
-        obj = (
+        queryset = (
             NotificationModel.objects
             .select_for_update(skip_locked=True)
             .filter(status=NotificationStatus.PENDING)
-            .order_by("created_at")
-            .first()
         )
+        if uuid is not None:
+            queryset = queryset.filter(uuid=uuid)
+        obj = queryset.order_by("created_at").first()
         result = self._model_to_entity(obj) if obj else None
         if result:
             logger.debug(f"Fetched pending notification: {result.uuid}")
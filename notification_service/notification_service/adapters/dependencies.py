@@ -2,11 +2,11 @@ from django.conf import settings
 from loguru import logger
 
 from notification_service.adapters.db.unit_of_work import DjangoUnitOfWork
-from notification_service.adapters.user_provider.keycloak import (
-    KeycloakUserProvider
-)
 from notification_service.adapters.user_provider.local import LocalUserProvider
 from notification_service.application.ports.unit_of_work import UnitOfWorkPort
+from notification_service.application.ports.notification_dispatcher import (
+    NotificationDispatcherPort
+)
 from notification_service.application.ports.user_provider import (
     UserProviderPort
 )
@@ -26,6 +26,11 @@ def get_user_provider() -> UserProviderPort:
         and settings.JWT_KEYCLOAK_ADMIN_LOGIN
         and settings.JWT_KEYCLOAK_ADMIN_PASSWORD
     ):
+        # Imported here, so Celery workers and tests, which don't use
+        # Keycloak, don't pay for python-keycloak and its admin client.
+        from notification_service.adapters.user_provider.keycloak import (
+            KeycloakUserProvider
+        )
         logger.info("Keycloak is enabled as UserProvider.")
         return KeycloakUserProvider()
     logger.info("Keycloak is not available as UserProvider. Using Local.")
@@ -40,4 +45,19 @@ def get_unit_of_work() -> UnitOfWorkPort:
     UnitOfWorkPort
         Adapter implementation of UnitOfWorkPort.
     """
-    return DjangoUnitOfWork()
\ No newline at end of file
+    return DjangoUnitOfWork()
+
+def get_notification_dispatcher() -> NotificationDispatcherPort:
+    """
+    Get notification dispatcher instance.
+
+    Returns
+    ----------
+    NotificationDispatcherPort
+        Adapter implementation of NotificationDispatcherPort.
+    """
+    # Imported here, since Celery tasks depend on this module.
+    from notification_service.adapters.workers.dispatcher import (
+        CeleryNotificationDispatcher
+    )
+    return CeleryNotificationDispatcher()
@@ -1,5 +1,8 @@
 from uuid import UUID
+from threading import Lock
 
+from cachetools import TTLCache
+from pybreaker import CircuitBreaker, CircuitBreakerError
 from keycloak.exceptions import (
     KeycloakError,
     KeycloakGetError,
@@ -23,18 +26,107 @@ from notification_service.application.ports.user_provider import (
 )
 
 
+# Notification types by their values, to parse Keycloak attributes
+# with a dict lookup instead of catching ValueError from the enum.
+_NOTIFICATION_TYPES = {
+    notification_type.value: notification_type
+    for notification_type in NotificationType
+}
+
+
 class KeycloakUserProvider(UserProviderPort):
     """
     Keycloak user provider.
 
     Provides user notification settings by fetching from Keycloak.
+    Fetched settings are cached per process for SETTINGS_TTL seconds,
+    so sending a batch of notifications to the same user
+    makes a single request to Keycloak. Users, which weren't found,
+    are remembered for MISSING_USER_TTL seconds.
+
+    After BREAKER_FAIL_MAX failed requests in a row, Keycloak isn't
+    called for BREAKER_RESET_TIMEOUT seconds, and lookups fail
+    with TemporaryFailure right away.
     """
+    SETTINGS_TTL = 30
+    MISSING_USER_TTL = 60
+    BREAKER_FAIL_MAX = 5
+    BREAKER_RESET_TIMEOUT = 30
+
+    _settings_cache = TTLCache(maxsize=1024, ttl=SETTINGS_TTL)
+    _missing_users = TTLCache(maxsize=4096, ttl=MISSING_USER_TTL)
+    _settings_cache_lock = Lock()
+    _breaker = CircuitBreaker(
+        fail_max=BREAKER_FAIL_MAX,
+        reset_timeout=BREAKER_RESET_TIMEOUT,
+        exclude=[UserNotFound],
+    )
+
     def get_notification_settings(
             self,
             user_uuid: UUID
     ) -> UserNotificationsSettings:
         """
-        Get notification settings for a user from Keycloak.
+        Get notification settings for a user from Keycloak,
+        using cached ones if they were fetched recently.
+
+        Parameters
+        ----------
+        user_uuid : UUID
+            UUID of the user
+
+        Returns
+        ----------
+        UserNotificationsSettings
+            Notification settings for the user
+
+        Raises
+        ----------
+        UserNotFound
+            If user is not found in Keycloak or wasn't found recently
+        TemporaryFailure
+            If Keycloak is unavailable
+        """
+        with self._settings_cache_lock:
+            settings = self._settings_cache.get(user_uuid)
+            missing = user_uuid in self._missing_users
+        if settings is not None:
+            logger.debug(
+                "Using cached notification settings for user {}",
+                user_uuid
+            )
+            return settings
+        if missing:
+            logger.debug(
+                "User {} wasn't found in Keycloak recently",
+                user_uuid
+            )
+            raise UserNotFound(f"User {user_uuid} not found in Keycloak")
+        try:
+            settings = self._breaker.call(
+                self._fetch_notification_settings,
+                user_uuid
+            )
+        except CircuitBreakerError:
+            logger.error(
+                "Keycloak circuit is open, skipping request for user {}",
+                user_uuid
+            )
+            raise TemporaryFailure("Keycloak server is unavailable")
+        except UserNotFound:
+            with self._settings_cache_lock:
+                self._missing_users[user_uuid] = True
+            raise
+        with self._settings_cache_lock:
+            self._settings_cache[user_uuid] = settings
+        return settings
+
+    def _fetch_notification_settings(
+            self,
+            user_uuid: UUID
+    ) -> UserNotificationsSettings:
+        """
+        Fetch notification settings for a user from Keycloak.
 
         Parameters
         ----------
@@ -45,50 +137,88 @@ class KeycloakUserProvider(UserProviderPort):
         ----------
         UserNotificationsSettings
             Notification settings for the user
+
+        Raises
+        ----------
+        UserNotFound
+            If Keycloak responds that the user doesn't exist
+        TemporaryFailure
+            If Keycloak is unavailable or responds with another error
         """
         logger.debug(
-            f"Fetching notification settings for user {user_uuid} "
-            "from Keycloak"
+            "Fetching notification settings for user {} from Keycloak",
+            user_uuid
         )
         try:
             user_data = keycloak_admin.get_user(str(user_uuid))
             logger.debug(
-                f"Successfully retrieved user data for {user_uuid} "
-                f"from Keycloak: {user_data}"
+                "Successfully retrieved user data for {} from Keycloak",
+                user_uuid
+            )
+        except KeycloakGetError as e:
+            if e.response_code == 404:
+                logger.warning("User {} not found in Keycloak", user_uuid)
+                raise UserNotFound(f"User {user_uuid} not found in Keycloak")
+            # Other statuses, such as 403 or 5xx, say nothing about
+            # the user, so they mustn't be remembered as missing users.
+            logger.error(
+                "Keycloak returned status {} for user {}: {}",
+                e.response_code,
+                user_uuid,
+                e
+            )
+            raise TemporaryFailure(
+                f"Keycloak returned status {e.response_code}"
             )
-        except KeycloakGetError:
-            logger.warning(f"User {user_uuid} not found in Keycloak")
-            raise UserNotFound(f"User {user_uuid} not found in Keycloak")
         except (KeycloakError, KeycloakConnectionError) as e:
             logger.error(
-                f"Couldn't connect to Keycloak "
-                f"server for user {user_uuid}: {e}"
+                "Couldn't connect to Keycloak server for user {}: {}",
+                user_uuid,
+                e
             )
             raise TemporaryFailure("Cannot connect to Keycloak server")
 
-        attributes = user_data.get("attributes", {})
+        settings = self._user_to_settings(user_uuid, user_data)
         logger.debug(
-            f"Retrieved attributes for user {user_uuid}: "
-            f"{list(attributes.keys())}"
+            "Created notification settings for user {}: {}",
+            user_uuid,
+            settings
         )
+        return settings
+
+    @staticmethod
+    def _user_to_settings(
+            user_uuid: UUID,
+            user_data: dict
+    ) -> UserNotificationsSettings:
+        """
+        Convert Keycloak user representation to notification settings.
+
+        Parameters
+        ----------
+        user_uuid : UUID
+            UUID of the user
+        user_data : dict
+            User representation returned by Keycloak
 
+        Returns
+        ----------
+        UserNotificationsSettings
+            Notification settings for the user
+        """
+        get_attribute = user_data.get("attributes", {}).get
         channels = {
-            notification_type: attributes[notification_type][0]
+            notification_type: values[0]
             for notification_type in NotificationType
-            if notification_type in attributes
+            if (values := get_attribute(notification_type))
         }
-        logger.debug(
-            f"Processed notification channels for user {user_uuid}: {channels}"
-        )
-
-        settings = UserNotificationsSettings(
+        preferred_channel = (
+            get_attribute("preferred_notification_channel") or [None]
+        )[0]
+        return UserNotificationsSettings(
             user_uuid=user_uuid,
             notification_channels=channels,
-            preferred_notification_channel=attributes.get(
-                "preferred_notification_channel"
+            preferred_notification_channel=_NOTIFICATION_TYPES.get(
+                preferred_channel
             )
         )
-        logger.debug(
-            f"Created notification settings for user {user_uuid}: {settings}"
-        )
-        return settings
\ No newline at end of file
@@ -1,4 +1,5 @@
 from uuid import UUID
+from types import MappingProxyType
 
 from loguru import logger
 
@@ -56,7 +57,8 @@ class LocalUserProvider(UserProviderPort):
         )
         return settings
 
-    _local_users = {
+    # Shared by all instances, so it is read-only.
+    _local_users = MappingProxyType({
         UUID("00000000-0000-0000-0000-000000000000"): (
             UserNotificationsSettings(
                 user_uuid=UUID("00000000-0000-0000-0000-000000000000"),
@@ -78,4 +80,4 @@ class LocalUserProvider(UserProviderPort):
                 preferred_notification_channel=NotificationType.PUSH
             )
         ),
-    }
+    })
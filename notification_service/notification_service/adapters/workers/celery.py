@@ -1,4 +1,8 @@
+from uuid import UUID
+from dataclasses import replace
+
 from celery import shared_task
+from django.conf import settings
 from loguru import logger
 
 from notification_service.adapters.dependencies import (
@@ -14,6 +18,9 @@ from notification_service.application.ports.exceptions.workers import (
 from notification_service.application.ports.exceptions.user_provider import (
     UserNotFound,
 )
+from notification_service.application.ports.user_provider import (
+    UserProviderPort
+)
 from notification_service.domain.enums import NotificationStatus
 from notification_service.adapters.workers.notification_channels import (
     get_notification_channel
@@ -32,17 +39,69 @@ def send_notifications():
 
     Fetches pending notifications from the database and sends them
     using appropriate notification channels based on user preferences.
+    Runs periodically to pick up notifications that were not dispatched,
+    sending up to NOTIFICATIONS_SEND_BATCH_SIZE of them per run.
     """
     logger.info("Checking for pending notifications to send")
-    uow = get_unit_of_work()
     user_provider = get_user_provider()
+    processed = 0
+    for _ in range(settings.NOTIFICATIONS_SEND_BATCH_SIZE):
+        if not _deliver_pending(user_provider):
+            break
+        processed += 1
+    logger.info("Processed {} pending notifications", processed)
+
+
+@shared_task(
+    acks_late=True,
+    autoretry_for=(NotificationServiceError,),
+    retry_backoff_max=500,
+    retry_backoff=5,
+    max_retries=5
+)
+def deliver_notification(notification_uuid: str):
+    """
+    Celery task to send a single notification right after it was created.
+
+    Parameters
+    ----------
+    notification_uuid : str
+        Hex representation of the notification UUID
+    """
+    logger.info(f"Delivering notification {notification_uuid}")
+    _deliver_pending(get_user_provider(), UUID(notification_uuid))
+
+
+def _deliver_pending(
+        user_provider: UserProviderPort,
+        uuid: UUID | None = None
+) -> bool:
+    """
+    Send a pending notification using appropriate notification channels.
+    Each notification is processed in its own transaction.
+
+    Parameters
+    ----------
+    user_provider : UserProviderPort
+        User provider to get notification settings from
+    uuid : UUID | None
+        UUID of the notification to send.
+        If None, the oldest pending notification is sent.
+
+    Returns
+    ----------
+    bool
+        True if a notification was processed,
+        False if there was no pending notification.
+    """
+    uow = get_unit_of_work()
 
     with uow:
-        notification = uow.notification_repo.get_pending_for_update()
+        notification = uow.notification_repo.get_pending_for_update(uuid)
         logger.debug(f"Fetched notification: {notification}")
         if not notification:
             logger.debug("No notification is pending right now.")
-            return
+            return False
         
         logger.info(
             f"Processing notification {notification.uuid} for "
@@ -63,9 +122,11 @@ def send_notifications():
                 f"marking notification {notification.uuid} "
                 f"as FAILED"
             )
-            notification.status = NotificationStatus.FAILED
+            notification = replace(
+                notification, status=NotificationStatus.FAILED
+            )
             uow.notification_repo.update(notification)
-            return
+            return True
         
         if notification.type:
             logger.debug(
@@ -78,9 +139,11 @@ def send_notifications():
                     f"have {notification.type} enabled, marking "
                     f"notification {notification.uuid} as FAILED"
                 )
-                notification.status = NotificationStatus.FAILED
+                notification = replace(
+                    notification, status=NotificationStatus.FAILED
+                )
                 uow.notification_repo.update(notification)
-                return
+                return True
             notification_channel_types = [notification.type]
         else:
             logger.debug(
@@ -146,13 +209,17 @@ def send_notifications():
                 f"{notification.uuid} via {channel_type} "
                 f"on attempt {attempt + 1}"
             )
-            notification.status = NotificationStatus.SENT
+            notification = replace(
+                notification, status=NotificationStatus.SENT
+            )
             uow.notification_repo.update(notification)
-            return
+            return True
         logger.warning(
             f"All notification channels failed for notification "
             f"{notification.uuid}, marking as FAILED"
         )
-        notification.status = NotificationStatus.FAILED
+        notification = replace(
+            notification, status=NotificationStatus.FAILED
+        )
         uow.notification_repo.update(notification)
-        return
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -0,0 +1,48 @@
+from django.db import transaction
+from loguru import logger
+
+from notification_service.application.ports.notification_dispatcher import (
+    NotificationDispatcherPort
+)
+from notification_service.domain.entities import Notification
+from notification_service.adapters.workers.celery import deliver_notification
+
+
+class CeleryNotificationDispatcher(NotificationDispatcherPort):
+    """
+    Celery-based notification dispatcher.
+    Publishes a delivery task for a notification once it is committed.
+    """
+    def dispatch(self, notification: Notification) -> None:
+        """
+        Publish delivery task for the notification after the current
+        transaction commits, so the worker always sees the stored row.
+
+        Parameters
+        ----------
+        notification : Notification
+            Notification object to deliver
+        """
+        transaction.on_commit(lambda: self._publish(notification))
+
+    @staticmethod
+    def _publish(notification: Notification) -> None:
+        """
+        Publish delivery task to the broker.
+        Broker errors are only logged: pending notifications
+        are still picked up by the periodic send_notifications task.
+
+        Parameters
+        ----------
+        notification : Notification
+            Notification object to deliver
+        """
+        try:
+            deliver_notification.delay(notification.uuid.hex)
+        except Exception as error:
+            logger.warning(
+                f"Failed to dispatch notification {notification.uuid}, "
+                f"leaving it to periodic task: {str(error)}"
+            )
+            return
+        logger.debug(f"Dispatched notification {notification.uuid}")
@@ -1,5 +1,6 @@
 import smtplib
 from uuid import UUID
+from threading import Lock
 from abc import ABC, abstractmethod
 from email.message import EmailMessage
 
@@ -17,6 +18,11 @@ from notification_service.domain.enums import NotificationType
 from notification_service.adapters.dependencies import get_user_provider
 
 
+# Shared by HTTP-based channels, so connections to notification services
+# are kept alive and reused instead of being opened for every request.
+_http_session = requests.Session()
+
+
 def get_notification_channel(
         notification_type: NotificationType
 ) -> "NotificationChannel":
@@ -39,13 +45,7 @@ def get_notification_channel(
         If notification type is not supported
     """
     logger.debug(f"Getting notification channel for type: {notification_type}")
-    channels = {
-        NotificationType.EMAIL: EmailNotificationChannel(),
-        NotificationType.SMS: SMSNotificationChannel(),
-        NotificationType.PUSH: PushNotificationChannel(),
-        NotificationType.TELEGRAM: TelegramNotificationChannel()
-    }
-    if notification_type not in channels:
+    if notification_type not in _channels:
         message = (
             f"Notification type {notification_type} is not supported "
             f"by any notification channel."
@@ -55,7 +55,7 @@ def get_notification_channel(
     logger.debug(
         f"Successfully retrieved channel for type: {notification_type}"
     )
-    return channels[notification_type]
+    return _channels[notification_type]
 
 
 class NotificationChannel(ABC):
@@ -85,8 +85,13 @@ class EmailNotificationChannel(NotificationChannel):
     Email notification channel.
 
     Sends notifications via email.
+    SMTP connection is kept open and reused by subsequent emails.
     """
     type = NotificationType.EMAIL
+
+    def __init__(self):
+        self._server: smtplib.SMTP | None = None
+        self._server_lock = Lock()
     
     def send(self, notification: Notification):
         logger.debug(
@@ -164,16 +169,45 @@ class EmailNotificationChannel(NotificationChannel):
         msg["To"] = to_email
         msg.set_content(body)
 
+        with self._server_lock:
+            try:
+                self._get_server().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server closes connections, which were idle for too long,
+                # so connect again and retry once.
+                logger.debug("SMTP connection was closed, reconnecting")
+                self._server = None
+                self._get_server().send_message(msg)
+
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        Get open SMTP connection, connecting to the server
+        if there is no connection yet.
+
+        Returns
+        ----------
+        smtplib.SMTP
+            Connection to the SMTP server
+        """
+        if self._server is not None:
+            return self._server
+
         smtp_server = settings.EMAIL_NOTIFICATIONS_SMTP_SERVER
         smtp_port = settings.EMAIL_NOTIFICATIONS_SMTP_PORT
         smtp_username = settings.EMAIL_NOTIFICATIONS_SMTP_USERNAME
         smtp_password = settings.EMAIL_NOTIFICATIONS_SMTP_PASSWORD
 
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
+        logger.debug("Connecting to SMTP server {}", smtp_server)
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        try:
             server.starttls()
             if smtp_username and smtp_password:
                 server.login(smtp_username, smtp_password)
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        return server
 
 
 class SMSNotificationChannel(NotificationChannel):
@@ -258,7 +292,7 @@ class SMSNotificationChannel(NotificationChannel):
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
-        response = requests.post(
+        response = _http_session.post(
             service_url,
             json=payload,
             headers=headers
@@ -368,7 +402,7 @@ class PushNotificationChannel(NotificationChannel):
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
-        response = requests.post(
+        response = _http_session.post(
             service_url,
             json=payload,
             headers=headers
@@ -471,7 +505,7 @@ class TelegramNotificationChannel(NotificationChannel):
             "text": f"{title or 'Notification'}\n\n{body}",
             "parse_mode": "HTML"
         }
-        response = requests.post(telegram_api_url, data=payload)
+        response = _http_session.post(telegram_api_url, data=payload)
 
         if response.status_code != 200 or not response.json().get("ok"):
             logger.error(
@@ -482,4 +516,16 @@ class TelegramNotificationChannel(NotificationChannel):
                 f"Telegram message sending failed "
                 f"with status {response.status_code}"
             )
-    
\ No newline at end of file
+
+
+# Channels keep open connections between notifications,
+# so one instance of each channel is shared by all callers.
+_channels = {
+    channel.type: channel
+    for channel in (
+        EmailNotificationChannel(),
+        SMSNotificationChannel(),
+        PushNotificationChannel(),
+        TelegramNotificationChannel(),
+    )
+}
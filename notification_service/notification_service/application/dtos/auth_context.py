@@ -2,7 +2,7 @@ from uuid import UUID
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class AuthContext:
     """
     Authentication context data class.
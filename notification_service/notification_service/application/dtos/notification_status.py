@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from notification_service.domain.enums import NotificationStatus
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class NotificationStatusDTO:
     """
     Data transfer object for notification status.
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from notification_service.domain.enums import NotificationType
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class UserNotificationsSettings:
     """
     Data transfer object for user notification settings.
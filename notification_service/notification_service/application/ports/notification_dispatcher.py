@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from notification_service.domain.entities import Notification
+
+
+class NotificationDispatcherPort(ABC):
+    """
+    Abstract base class for notification dispatcher port.
+    Defines the interface for handing notifications over to delivery.
+    """
+    @abstractmethod
+    def dispatch(self, notification: Notification) -> None:
+        """
+        Schedule delivery of a stored notification.
+
+        Parameters
+        ----------
+        notification : Notification
+            Notification object to deliver
+        """
+        ...
@@ -43,6 +43,27 @@ class NotificationRepositoryPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def create_or_get(
+            self,
+            notification: Notification
+    ) -> tuple[Notification, bool]:
+        """
+        Create a new notification or get the existing one with the same UUID.
+
+        Parameters
+        ----------
+        notification : Notification
+            Notification object to create
+
+        Returns
+        ----------
+        tuple[Notification, bool]
+            Stored notification object and True if it was created,
+            False if it already existed.
+        """
+        ...
+
     @abstractmethod
     def update(self, notification: Notification) -> Notification:
         """
@@ -78,11 +99,20 @@ class NotificationRepositoryPort(ABC):
         ...
 
     @abstractmethod
-    def get_pending_for_update(self) -> Notification | None:
+    def get_pending_for_update(
+            self,
+            uuid: UUID | None = None
+    ) -> Notification | None:
         """
         Get pending notification for update,
         locking a row while transaction is alive.
 
+        Parameters
+        ----------
+        uuid : UUID | None
+            UUID of the notification to get.
+            If None, the oldest pending notification is returned.
+
         Returns
         ----------
         Notification or None
@@ -1,19 +1,39 @@
+from threading import Lock
+
+from cachetools import TTLCache
 from loguru import logger
 
 from notification_service.application.dtos.notification_status import (
     NotificationStatusDTO
 )
 from notification_service.domain.entities import Notification
+from notification_service.domain.enums import TERMINAL_STATUSES
 from notification_service.application.ports.unit_of_work import (
     UnitOfWorkPort
 )
+from notification_service.application.ports.notification_dispatcher import (
+    NotificationDispatcherPort
+)
+
+
+# Process-local cache of notification statuses, keyed by ``UUID.int``.
+# Only terminal statuses are stored: the worker updates statuses
+# in another process, so a cached pending status could become stale.
+_seen: TTLCache = TTLCache(maxsize=100_000, ttl=300)
+# TTLCache isn't thread-safe, and views run in threads of one process.
+_seen_lock = Lock()
+
 
 class SendNotificationUseCase:
     """
     Use case for sending notifications.
     Handles the logic for creating and processing notifications.
     """
-    def __init__(self, uow: UnitOfWorkPort) -> None:
+    def __init__(
+            self,
+            uow: UnitOfWorkPort,
+            dispatcher: NotificationDispatcherPort | None = None
+    ) -> None:
         """
         Initialize the use case with a unit of work.
 
@@ -21,8 +41,12 @@ class SendNotificationUseCase:
         ----------
         uow : UnitOfWorkPort
             Unit of work instance
+        dispatcher : NotificationDispatcherPort | None
+            Dispatcher to hand new notifications over to delivery.
+            If None, notifications are left for the periodic worker task.
         """
         self.uow = uow
+        self.dispatcher = dispatcher
 
     def execute(self, notification: Notification) -> NotificationStatusDTO:
         """
@@ -38,42 +62,49 @@ class SendNotificationUseCase:
         NotificationStatusDTO
             Status information of the notification
         """
+        # Loguru formats positional arguments only when the record
+        # is emitted, so disabled DEBUG level costs no string formatting.
         logger.debug(
-            f"Executing send notification use case for notification "
-            f"{notification.uuid}"
+            "Executing send notification use case for notification {}",
+            notification.uuid
         )
-        was_created = False
-        if self.uow.notification_repo.exists(notification.uuid):
+        with _seen_lock:
+            cached_status = _seen.get(notification.uuid.int)
+        if cached_status is not None:
             logger.debug(
-                f"Notification {notification.uuid} already exists, "
-                f"fetching existing"
+                "Notification {} found in cache with status {}",
+                notification.uuid,
+                cached_status
             )
-            notification = self.uow.notification_repo.get_by_uuid(
-                notification.uuid
+            return NotificationStatusDTO(
+                notification.uuid, cached_status, False
             )
+        notification, was_created = (
+            self.uow.notification_repo.create_or_get(notification)
+        )
+        if was_created:
             logger.debug(
-                f"Fetched existing notification {notification.uuid} "
-                f"with status {notification.status}"
+                "Created new notification {} with status {}",
+                notification.uuid,
+                notification.status
             )
         else:
             logger.debug(
-                f"Notification {notification.uuid} is new, "
-                f"creating in repository"
-            )
-            with self.uow:
-                notification = self.uow.notification_repo.create(notification)
-            was_created = True
-            logger.debug(
-                f"Created new notification {notification.uuid} "
-                f"with status {notification.status}"
+                "Fetched existing notification {} with status {}",
+                notification.uuid,
+                notification.status
             )
+        if was_created and self.dispatcher:
+            self.dispatcher.dispatch(notification)
+        if notification.status in TERMINAL_STATUSES:
+            with _seen_lock:
+                _seen[notification.uuid.int] = notification.status
         result = NotificationStatusDTO(
-            uuid=notification.uuid,
-            status=notification.status,
-            was_created=was_created
+            notification.uuid, notification.status, was_created
         )
         logger.debug(
-            f"Returning notification status DTO for "
-            f"{notification.uuid}: {result}"
+            "Returning notification status DTO for {}: {}",
+            notification.uuid,
+            result
         )
         return result
@@ -10,6 +10,6 @@ celery_app.config_from_object(
     os.environ.get("DJANGO_SETTINGS_MODULE"),
     namespace="CELERY"
 )
-celery_app.autodiscover_tasks(["notification_service.adapters.workers.celery"])
+celery_app.conf.imports = ("notification_service.adapters.workers.celery",)
 
 
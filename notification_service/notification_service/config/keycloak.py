@@ -1,18 +1,107 @@
+import time
+import hashlib
+from threading import Lock
+
+from cachetools import TTLCache
+from jwcrypto import jwk
 from keycloak import KeycloakAdmin, KeycloakOpenID
 from django.conf import settings
 
+
+class CachingKeycloakOpenID(KeycloakOpenID):
+    """
+    KeycloakOpenID client, which caches realm public key
+    and results of token decoding.
+
+    Original client fetches realm public key with an HTTP request
+    and verifies RS256 signature on every decode_token call.
+    """
+    PUBLIC_KEY_TTL = 300
+    DECODED_TOKEN_TTL = 60
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._public_keys = TTLCache(maxsize=1, ttl=self.PUBLIC_KEY_TTL)
+        self._decoded_tokens = TTLCache(
+            maxsize=10_000,
+            ttl=self.DECODED_TOKEN_TTL
+        )
+        self._cache_lock = Lock()
+
+    def decode_token(
+            self,
+            token: str,
+            validate: bool = True,
+            **kwargs: dict
+    ) -> dict:
+        """
+        Decode user token, using cached claims if token was already
+        decoded recently and hasn't expired since then.
+
+        Parameters
+        ----------
+        token : str
+            Keycloak token
+        validate : bool
+            Whether the token should be validated with the public key
+        kwargs : dict
+            Additional keyword arguments for jwcrypto's JWT object
+
+        Returns
+        ----------
+        dict
+            Decoded token
+        """
+        if not validate or kwargs:
+            return super().decode_token(token, validate, **kwargs)
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            claims = self._decoded_tokens.get(cache_key)
+        if claims is not None and claims.get("exp", 0) > time.time():
+            return claims
+        claims = super().decode_token(token, key=self._get_public_jwk())
+        with self._cache_lock:
+            self._decoded_tokens[cache_key] = claims
+        return claims
+
+    def _get_public_jwk(self) -> jwk.JWK:
+        """
+        Get realm public key, fetching it from Keycloak
+        only when cached one is missing or outdated.
+
+        Returns
+        ----------
+        jwk.JWK
+            Realm public key
+        """
+        with self._cache_lock:
+            key = self._public_keys.get("key")
+        if key is None:
+            key = jwk.JWK.from_pem(
+                (
+                    "-----BEGIN PUBLIC KEY-----\n"
+                    + self.public_key()
+                    + "\n-----END PUBLIC KEY-----"
+                ).encode("utf-8")
+            )
+            with self._cache_lock:
+                self._public_keys["key"] = key
+        return key
+
+
 config = dict(
     server_url=settings.JWT_KEYCLOAK_URL,
     client_id=settings.JWT_KEYCLOAK_CLIENT_ID,
     realm_name=settings.JWT_KEYCLOAK_REALM,
     client_secret_key=settings.JWT_KEYCLOAK_SECRET_KEY,
-    verify=False
+    verify=False,
+    pool_maxsize=settings.JWT_KEYCLOAK_POOL_MAXSIZE,
+    max_retries=settings.JWT_KEYCLOAK_MAX_RETRIES,
 )
 
-keycloak_openid = KeycloakOpenID(**config)
+keycloak_openid = CachingKeycloakOpenID(**config)
 keycloak_admin = KeycloakAdmin(
     username=settings.JWT_KEYCLOAK_ADMIN_LOGIN,
     password=settings.JWT_KEYCLOAK_ADMIN_PASSWORD,
     **{**config, "client_id": "admin-cli"},
 )
-
@@ -160,6 +160,11 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": 2.0,
     },
 }
+NOTIFICATIONS_SEND_BATCH_SIZE = int(
+    os.getenv("NOTIFICATIONS_SEND_BATCH_SIZE", "100")
+)
+# Nothing reads task results, so don't store them
+CELERY_TASK_IGNORE_RESULT = True
 
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "localhost")
 RABBITMQ_PORT = os.getenv("RABBITMQ_PORT", "5672")
@@ -186,6 +191,10 @@ JWT_KEYCLOAK_CLIENT_ID = os.getenv(
 JWT_KEYCLOAK_ADMIN_LOGIN = os.getenv("JWT_KEYCLOAK_ADMIN_LOGIN", "admin")
 JWT_KEYCLOAK_ADMIN_PASSWORD = os.getenv("JWT_KEYCLOAK_ADMIN_PASSWORD", "admin")
 JWT_KEYCLOAK_URL = f"http://{JWT_KEYCLOAK_HOST}:{JWT_KEYCLOAK_PORT}"
+# HTTP connections to Keycloak kept open per client
+# and retries of failed requests to it
+JWT_KEYCLOAK_POOL_MAXSIZE = int(os.getenv("JWT_KEYCLOAK_POOL_MAXSIZE", "32"))
+JWT_KEYCLOAK_MAX_RETRIES = int(os.getenv("JWT_KEYCLOAK_MAX_RETRIES", "3"))
 
 
 JWT_AUTH_ENABLED = os.getenv("JWT_AUTH_ENABLED", "False") != "False"
@@ -1,3 +1,8 @@
+import os
+import sys
+
+from loguru import logger
+
 from notification_service.config.settings.base import *
 
 DEBUG = False
@@ -9,4 +14,10 @@ REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
 ALLOWED_HOSTS = [
     "localhost",
     "127.0.0.1"
-]
\ No newline at end of file
+]
+
+# Replace default DEBUG level sink, so debug calls return
+# before a log record is even built.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+logger.remove()
+logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True, serialize=True)
@@ -9,6 +9,13 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA synchronous=OFF;'
+                'PRAGMA journal_mode=MEMORY;'
+                'PRAGMA temp_store=MEMORY;'
+            ),
+        },
     }
 }
 
@@ -6,7 +6,7 @@ from notification_service.domain.enums import (
     NotificationStatus
 )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Notification:
     """
     Notification entity.
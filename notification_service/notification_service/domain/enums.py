@@ -18,3 +18,10 @@ class NotificationStatus(StrEnum):
     PENDING = auto()
     SENT = auto()
     FAILED = auto()
+
+
+# Statuses, which notification can't leave once it got one of them.
+TERMINAL_STATUSES = frozenset({
+    NotificationStatus.SENT,
+    NotificationStatus.FAILED,
+})
@@ -0,0 +1,106 @@
+"""Shared test fixtures."""
+
+from uuid import UUID
+from itertools import count
+from unittest.mock import create_autospec
+
+import pytest
+from django.db.models.signals import post_migrate
+from django.contrib.contenttypes.management import create_contenttypes
+
+from notification_service.domain.entities import Notification
+from notification_service.application.ports.repositories import (
+    NotificationRepositoryPort,
+)
+from notification_service.application.ports.unit_of_work import (
+    UnitOfWorkPort,
+)
+from notification_service.domain.enums import (
+    NotificationStatus,
+    NotificationType,
+)
+from notification_service.application.use_cases import send_notification
+
+
+# Deterministic UUIDs, unique within a test session.
+# They don't cost an os.urandom call, as uuid4 does, and start
+# above small values, which tests use for fixed UUIDs.
+_uuid_ints = count(0x1000)
+
+
+def _next_uuid() -> UUID:
+    return UUID(int=next(_uuid_ints))
+
+
+def pytest_configure(config):
+    """
+    Don't seed permissions and content types into the test database.
+    Tests never use auth models, and seeding them after tables are
+    created is most of the test database setup time.
+    """
+    post_migrate.disconnect(
+        dispatch_uid="django.contrib.auth.management.create_permissions"
+    )
+    post_migrate.disconnect(create_contenttypes)
+
+
+@pytest.fixture(autouse=True)
+def reset_seen_notifications():
+    """
+    Don't let statuses cached by the send notification use case
+    in one test leak into another.
+    """
+    with send_notification._seen_lock:
+        send_notification._seen.clear()
+
+
+@pytest.fixture
+def uow_factory():
+    """
+    Create factory of unit of work mocks.
+
+    The factory takes notifications, which get_pending_for_update
+    returns one by one before returning None.
+    Mocks are autospecced from the ports, so calls that don't match
+    the port signatures fail.
+    """
+    def make_uow(*pending):
+        uow = create_autospec(UnitOfWorkPort, instance=True)
+        uow.notification_repo = create_autospec(
+            NotificationRepositoryPort, instance=True
+        )
+        uow.__enter__.return_value = uow
+        uow.notification_repo.get_pending_for_update.side_effect = [
+            *pending, None
+        ]
+        return uow
+    return make_uow
+
+
+@pytest.fixture(scope="session")
+def make_uuid():
+    """
+    Create factory of UUIDs, unique within a test session.
+    Use it instead of uuid4, when UUID only has to be distinct.
+    """
+    return _next_uuid
+
+
+@pytest.fixture(scope="session")
+def make_notification():
+    """
+    Create factory of notifications.
+
+    Keyword arguments override default field values.
+    """
+    def make(**fields):
+        return Notification(**{
+            "uuid": _next_uuid(),
+            "user_uuid": _next_uuid(),
+            "title": "Test Title",
+            "text": "Test Text",
+            "type": NotificationType.EMAIL,
+            "status": NotificationStatus.PENDING,
+            **fields,
+        })
+    return make
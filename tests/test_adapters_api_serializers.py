@@ -14,6 +14,7 @@ from notification_service.domain.enums import (
 
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group("db")
 class TestNotificationSerializer:
     """Tests for NotificationSerializer."""
 
@@ -45,6 +46,24 @@ class TestNotificationSerializer:
         serializer = NotificationSerializer(data=data)
         assert serializer.is_valid() is True
 
+    def test_serializer_validation_existing_uuid(self):
+        """Test serializer accepts UUID of already stored notification."""
+        notification = NotificationModel.objects.create(
+            uuid=uuid4(),
+            user_uuid=uuid4(),
+            title="Test Title",
+            text="Test Text",
+        )
+        data = {
+            "uuid": str(notification.uuid),
+            "user_uuid": str(notification.user_uuid),
+            "title": "Test Title",
+            "text": "Test Text",
+        }
+
+        serializer = NotificationSerializer(data=data)
+        assert serializer.is_valid() is True
+
     def test_serializer_validation_missing_required_fields(self):
         """Test serializer validation with missing required fields."""
         data = {"uuid": str(uuid4())}
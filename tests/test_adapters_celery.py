@@ -1,12 +1,16 @@
 """Tests for Celery tasks."""
 
 from uuid import uuid4
+from types import SimpleNamespace
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from notification_service.adapters.workers.celery import send_notifications
-from notification_service.domain.entities import Notification
+from notification_service.adapters.workers import celery
+from notification_service.adapters.workers.celery import (
+    send_notifications,
+    deliver_notification,
+)
 from notification_service.domain.enums import (
     NotificationStatus,
     NotificationType,
@@ -22,48 +26,49 @@ from notification_service.application.dtos.user_notification_settings import (
 )
 
 
-@pytest.mark.django_db
+@pytest.fixture
+def celery_patches(monkeypatch):
+    """
+    Replace dependency getters used by Celery tasks with mocks.
+    Getters return a user provider and a channel, spec'd with the only
+    methods tasks call, so tests don't have to build them.
+    """
+    mocks = SimpleNamespace(
+        get_unit_of_work=Mock(),
+        get_user_provider=Mock(),
+        get_notification_channel=Mock(),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(celery, name, mock)
+    mocks.provider = Mock(spec=["get_notification_settings"])
+    mocks.channel = Mock(spec=["send"])
+    mocks.get_user_provider.return_value = mocks.provider
+    mocks.get_notification_channel.return_value = mocks.channel
+    return mocks
+
+
 class TestSendNotificationsTask:
     """Tests for send_notifications Celery task."""
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
     def test_send_notifications_no_pending(
-        self, mock_get_user_provider, mock_get_uow
+        self, celery_patches, uow_factory
     ):
         """Test task when there are no pending notifications."""
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = None
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
+        mock_uow = uow_factory()
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        mock_provider = Mock()
-        mock_get_user_provider.return_value = mock_provider
+        mock_provider = celery_patches.provider
 
         send_notifications()
 
         mock_uow.notification_repo.get_pending_for_update.assert_called_once()
         mock_provider.get_notification_settings.assert_not_called()
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    @patch(
-        "notification_service.adapters.workers.celery.get_notification_channel"
-    )
     def test_send_notifications_success(
-        self, mock_get_channel, mock_get_user_provider, mock_get_uow
+        self, celery_patches, uow_factory, make_notification
     ):
         """Test successful notification sending."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         user_settings = UserNotificationsSettings(
             user_uuid=notification.user_uuid,
@@ -71,30 +76,24 @@ class TestSendNotificationsTask:
             preferred_notification_channel=NotificationType.EMAIL,
         )
 
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
+        mock_uow = uow_factory(notification)
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        mock_provider = Mock()
+        mock_provider = celery_patches.provider
         mock_provider.get_notification_settings.return_value = user_settings
-        mock_get_user_provider.return_value = mock_provider
 
-        mock_channel = Mock()
-        mock_get_channel.return_value = mock_channel
+        mock_channel = celery_patches.channel
 
         send_notifications()
 
-        mock_uow.notification_repo.get_pending_for_update.assert_called_once()
+        get_pending = mock_uow.notification_repo.get_pending_for_update
+        assert get_pending.call_count == 2
         mock_provider.get_notification_settings.assert_called_once_with(
             user_uuid=notification.user_uuid
         )
-        mock_get_channel.assert_called_once_with(NotificationType.EMAIL)
+        celery_patches.get_notification_channel.assert_called_once_with(
+            NotificationType.EMAIL
+        )
         mock_channel.send.assert_called_once_with(notification)
         mock_uow.notification_repo.update.assert_called_once()
         updated_notification = (
@@ -102,103 +101,89 @@ class TestSendNotificationsTask:
         )
         assert updated_notification.status == NotificationStatus.SENT
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    def test_send_notifications_user_not_found(
-        self, mock_get_user_provider, mock_get_uow
-    ):
-        """Test notification sending when user is not found."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
-
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
-
-        mock_provider = Mock()
-        mock_provider.get_notification_settings.side_effect = UserNotFound()
-        mock_get_user_provider.return_value = mock_provider
-
-        send_notifications()
-
-        mock_uow.notification_repo.update.assert_called_once()
-        updated_notification = (
-            mock_uow.notification_repo.update.call_args[0][0]
-        )
-        assert updated_notification.status == NotificationStatus.FAILED
-
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    def test_send_notifications_user_doesnt_have_channel(
-        self, mock_get_user_provider, mock_get_uow
+    @pytest.mark.parametrize(
+        "notification_type, notification_channels, settings_error, send_error",
+        [
+            pytest.param(
+                NotificationType.EMAIL,
+                {NotificationType.EMAIL: "test@example.com"},
+                UserNotFound(),
+                None,
+                id="user_not_found",
+            ),
+            pytest.param(
+                NotificationType.EMAIL,
+                {NotificationType.SMS: "+1234567890"},
+                None,
+                None,
+                id="user_doesnt_have_channel",
+            ),
+            pytest.param(
+                NotificationType.EMAIL,
+                {
+                    NotificationType.EMAIL: "test@example.com",
+                    NotificationType.SMS: "+1234567890",
+                },
+                None,
+                NotificationChannelError("Channel error"),
+                id="channel_error",
+            ),
+            pytest.param(
+                NotificationType.SMS,
+                {
+                    NotificationType.EMAIL: "test@example.com",
+                    NotificationType.SMS: "+1234567890",
+                },
+                None,
+                ValueError("Unexpected error"),
+                id="channel_unexpected_exception",
+            ),
+        ],
+    )
+    def test_send_notifications_failed(
+        self,
+        celery_patches,
+        uow_factory,
+        notification_type,
+        notification_channels,
+        settings_error,
+        send_error,
+        make_notification,
     ):
-        """Test notification sending when user doesn't have required channel"""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        """Test cases, in which notification is marked as failed."""
+        notification = make_notification(type=notification_type)
 
         user_settings = UserNotificationsSettings(
             user_uuid=notification.user_uuid,
-            notification_channels={NotificationType.SMS: "+1234567890"},
-            preferred_notification_channel=NotificationType.SMS,
+            notification_channels=notification_channels,
+            preferred_notification_channel=next(iter(notification_channels)),
         )
 
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
+        mock_uow = uow_factory(notification)
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        mock_provider = Mock()
+        mock_provider = celery_patches.provider
         mock_provider.get_notification_settings.return_value = user_settings
-        mock_get_user_provider.return_value = mock_provider
+        mock_provider.get_notification_settings.side_effect = settings_error
+
+        mock_channel = celery_patches.channel
+        mock_channel.send.side_effect = send_error
 
         send_notifications()
 
+        for call in celery_patches.get_notification_channel.call_args_list:
+            assert call.args[0] == notification_type
         mock_uow.notification_repo.update.assert_called_once()
         updated_notification = (
             mock_uow.notification_repo.update.call_args[0][0]
         )
         assert updated_notification.status == NotificationStatus.FAILED
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    @patch(
-        "notification_service.adapters.workers.celery.get_notification_channel"
-    )
-    def test_send_notifications_channel_error(
-        self, mock_get_channel, mock_get_user_provider, mock_get_uow
+    def test_send_notifications_no_type_uses_preferred(
+        self, celery_patches, uow_factory, make_notification
     ):
-        """Test notification sending when channel raises error."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        """Test notification sending without type uses preferred channel."""
+        notification = make_notification(type=None)
 
         user_settings = UserNotificationsSettings(
             user_uuid=notification.user_uuid,
@@ -209,134 +194,72 @@ class TestSendNotificationsTask:
             preferred_notification_channel=NotificationType.EMAIL,
         )
 
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
+        mock_uow = uow_factory(notification)
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        mock_provider = Mock()
+        mock_provider = celery_patches.provider
         mock_provider.get_notification_settings.return_value = user_settings
-        mock_get_user_provider.return_value = mock_provider
 
-        mock_channel = Mock()
-        mock_channel.send.side_effect = NotificationChannelError(
-            "Channel error"
-        )
-        mock_get_channel.return_value = mock_channel
+        mock_channel = celery_patches.channel
 
         send_notifications()
 
-        assert mock_uow.notification_repo.update.called
-        updated_notification = (
-            mock_uow.notification_repo.update.call_args[0][0]
-        )
-        assert updated_notification.status == NotificationStatus.FAILED
+        assert celery_patches.get_notification_channel.called
+        channel_type = celery_patches.get_notification_channel.call_args[0][0]
+        assert channel_type == NotificationType.EMAIL
+        assert mock_channel.send.called
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    @patch(
-        "notification_service.adapters.workers.celery.get_notification_channel"
-    )
-    def test_send_notifications_no_type_uses_preferred(
-        self, mock_get_channel, mock_get_user_provider, mock_get_uow
+    def test_send_notifications_batch_size(
+        self, celery_patches, uow_factory, settings, make_notification
     ):
-        """Test notification sending without type uses preferred channel."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=None,
-            status=NotificationStatus.PENDING,
+        """Test that task sends at most batch size notifications per run."""
+        settings.NOTIFICATIONS_SEND_BATCH_SIZE = 2
+        notification = make_notification()
+
+        mock_uow = uow_factory(notification, notification, notification)
+        celery_patches.get_unit_of_work.return_value = mock_uow
+
+        mock_provider = celery_patches.provider
+        mock_provider.get_notification_settings.return_value = (
+            UserNotificationsSettings(
+                user_uuid=notification.user_uuid,
+                notification_channels={
+                    NotificationType.EMAIL: "test@example.com"
+                },
+                preferred_notification_channel=NotificationType.EMAIL,
+            )
         )
 
-        user_settings = UserNotificationsSettings(
-            user_uuid=notification.user_uuid,
-            notification_channels={
-                NotificationType.EMAIL: "test@example.com",
-                NotificationType.SMS: "+1234567890",
-            },
-            preferred_notification_channel=NotificationType.EMAIL,
-        )
-
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
-
-        mock_provider = Mock()
-        mock_provider.get_notification_settings.return_value = user_settings
-        mock_get_user_provider.return_value = mock_provider
-
-        mock_channel = Mock()
-        mock_get_channel.return_value = mock_channel
-
         send_notifications()
 
-        assert mock_get_channel.called
-        assert mock_get_channel.call_args[0][0] == NotificationType.EMAIL
-        assert mock_channel.send.called
+        assert mock_uow.notification_repo.update.call_count == 2
+        celery_patches.get_user_provider.assert_called_once()
 
-    @patch("notification_service.adapters.workers.celery.get_unit_of_work")
-    @patch("notification_service.adapters.workers.celery.get_user_provider")
-    @patch(
-        "notification_service.adapters.workers.celery.get_notification_channel"
-    )
-    def test_send_notifications_channel_unexpected_exception(
-        self, mock_get_channel, mock_get_user_provider, mock_get_uow
+    def test_send_notifications_zero_batch_size(
+        self, celery_patches, uow_factory, settings, make_notification
     ):
-        """Test notification sending when channel raises unexpected error."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.SMS,
-            status=NotificationStatus.PENDING,
-        )
+        """Test that task does nothing when batch size is zero."""
+        settings.NOTIFICATIONS_SEND_BATCH_SIZE = 0
+        mock_uow = uow_factory(make_notification())
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        user_settings = UserNotificationsSettings(
-            user_uuid=notification.user_uuid,
-            notification_channels={
-                NotificationType.EMAIL: "test@example.com",
-                NotificationType.SMS: "+1234567890",
-            },
-            preferred_notification_channel=NotificationType.EMAIL,
-        )
+        send_notifications()
 
-        mock_uow = Mock()
-        mock_uow.notification_repo = Mock()
-        mock_uow.notification_repo.get_pending_for_update.return_value = (
-            notification
-        )
-        mock_uow.notification_repo.update = Mock()
-        mock_uow.__enter__ = Mock(return_value=mock_uow)
-        mock_uow.__exit__ = Mock(return_value=None)
-        mock_get_uow.return_value = mock_uow
+        mock_uow.notification_repo.update.assert_not_called()
 
-        mock_provider = Mock()
-        mock_provider.get_notification_settings.return_value = user_settings
-        mock_get_user_provider.return_value = mock_provider
 
-        mock_channel = Mock()
-        mock_channel.send.side_effect = ValueError("Unexpected error")
-        mock_get_channel.return_value = mock_channel
+class TestDeliverNotificationTask:
+    """Tests for deliver_notification Celery task."""
 
-        send_notifications()
+    def test_deliver_notification_fetches_by_uuid(
+        self, celery_patches, uow_factory
+    ):
+        """Test task locks the specified notification."""
+        notification_uuid = uuid4()
+        mock_uow = uow_factory()
+        celery_patches.get_unit_of_work.return_value = mock_uow
 
-        assert mock_get_channel.call_args[0][0] == NotificationType.SMS
-        assert mock_uow.notification_repo.update.called
-        updated_notification = (
-            mock_uow.notification_repo.update.call_args[0][0]
-        )
-        assert updated_notification.status == NotificationStatus.FAILED
+        deliver_notification(notification_uuid.hex)
+
+        get_pending = mock_uow.notification_repo.get_pending_for_update
+        get_pending.assert_called_once_with(notification_uuid)
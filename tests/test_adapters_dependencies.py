@@ -5,8 +5,12 @@ from unittest.mock import patch
 from notification_service.adapters.dependencies import (
     get_user_provider,
     get_unit_of_work,
+    get_notification_dispatcher,
 )
 from notification_service.adapters.db.unit_of_work import DjangoUnitOfWork
+from notification_service.adapters.workers.dispatcher import (
+    CeleryNotificationDispatcher,
+)
 from notification_service.adapters.user_provider.local import LocalUserProvider
 from notification_service.adapters.user_provider.keycloak import (
     KeycloakUserProvider,
@@ -59,3 +63,12 @@ class TestGetUnitOfWork:
 
         assert isinstance(uow, DjangoUnitOfWork)
 
+
+class TestGetNotificationDispatcher:
+    """Tests for get_notification_dispatcher function."""
+
+    def test_get_notification_dispatcher(self):
+        """Test getting notification dispatcher instance."""
+        dispatcher = get_notification_dispatcher()
+
+        assert isinstance(dispatcher, CeleryNotificationDispatcher)
@@ -1,13 +1,14 @@
 """Tests for adapter repositories."""
 
 from uuid import uuid4
+from dataclasses import replace
 
 import pytest
+from django.db import IntegrityError
 
 from notification_service.adapters.db.repositories import (
     DjangoNotificationRepository,
 )
-from notification_service.domain.entities import Notification
 from notification_service.domain.enums import (
     NotificationStatus,
     NotificationType,
@@ -18,6 +19,7 @@ from notification_service.application.ports.exceptions.repository import (
 
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group("db")
 class TestDjangoNotificationRepository:
     """Tests for DjangoNotificationRepository."""
 
@@ -27,17 +29,10 @@ class TestDjangoNotificationRepository:
 
         assert repo is not None
 
-    def test_exists_found(self):
+    def test_exists_found(self, make_notification):
         """Test exists method when notification exists."""
         repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         repo.create(notification)
         result = repo.exists(notification.uuid)
@@ -53,27 +48,15 @@ class TestDjangoNotificationRepository:
 
         assert result is False
 
-    def test_get_by_uuid_success(self):
+    def test_get_by_uuid_success(self, make_notification):
         """Test get_by_uuid method for existing notification."""
         repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         created = repo.create(notification)
         retrieved = repo.get_by_uuid(created.uuid)
 
-        assert retrieved.uuid == created.uuid
-        assert retrieved.user_uuid == created.user_uuid
-        assert retrieved.title == created.title
-        assert retrieved.text == created.text
-        assert retrieved.type == created.type
-        assert retrieved.status == created.status
+        assert retrieved == created
 
     def test_get_by_uuid_not_found(self):
         """Test get_by_uuid method when notification does not exist."""
@@ -83,17 +66,18 @@ class TestDjangoNotificationRepository:
         with pytest.raises(ObjectNotFoundInRepository):
             repo.get_by_uuid(fake_uuid)
 
-    def test_create_success(self):
+    def test_update_not_found(self, make_notification):
+        """Test update method when notification does not exist."""
+        repo = DjangoNotificationRepository()
+        notification = make_notification()
+
+        with pytest.raises(ObjectNotFoundInRepository):
+            repo.update(notification)
+
+    def test_create_success(self, make_notification):
         """Test create method."""
         repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         created = repo.create(notification)
 
@@ -104,20 +88,48 @@ class TestDjangoNotificationRepository:
         assert created.type == notification.type
         assert created.status == notification.status
 
-    def test_update_success(self):
+    def test_create_duplicate_uuid(self, make_notification):
+        """Test that notification UUID is unique."""
+        repo = DjangoNotificationRepository()
+        notification = make_notification()
+
+        repo.create(notification)
+
+        with pytest.raises(IntegrityError):
+            repo.create(notification)
+
+    def test_create_or_get_new(self, make_notification):
+        """Test create_or_get method for a new notification."""
+        repo = DjangoNotificationRepository()
+        notification = make_notification()
+
+        created, was_created = repo.create_or_get(notification)
+
+        assert was_created is True
+        assert created.uuid == notification.uuid
+        assert created.status == NotificationStatus.PENDING
+        assert repo.exists(notification.uuid) is True
+
+    def test_create_or_get_existing(self, make_notification):
+        """Test create_or_get method for an existing notification."""
+        repo = DjangoNotificationRepository()
+        notification = make_notification()
+        repo.create(notification)
+        repo.update(replace(notification, status=NotificationStatus.SENT))
+
+        existing, was_created = repo.create_or_get(notification)
+
+        assert was_created is False
+        assert existing.uuid == notification.uuid
+        assert existing.status == NotificationStatus.SENT
+
+    def test_update_success(self, make_notification):
         """Test update method."""
         repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         created = repo.create(notification)
-        updated_notification = Notification(
+        updated_notification = make_notification(
             uuid=created.uuid,
             user_uuid=created.user_uuid,
             title="Updated",
@@ -134,35 +146,13 @@ class TestDjangoNotificationRepository:
         assert updated.type == NotificationType.SMS
         assert updated.status == NotificationStatus.SENT
 
-    def test_update_not_found(self):
-        """Test update method when notification does not exist."""
-        repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
-
-        with pytest.raises(ObjectNotFoundInRepository):
-            repo.update(notification)
-
-    def test_get_pending_for_update_found(self):
+    def test_get_pending_for_update_found(self, make_notification):
         """
         Test get_pending_for_update method
         when pending notification exists.
         """
         repo = DjangoNotificationRepository()
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test",
-            text="Test text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        notification = make_notification()
 
         repo.create(notification)
         result = repo.get_pending_for_update()
@@ -181,3 +171,21 @@ class TestDjangoNotificationRepository:
         result = repo.get_pending_for_update()
 
         assert result is None
+
+    def test_get_pending_for_update_by_uuid(self, make_notification):
+        """
+        Test get_pending_for_update method
+        when notification UUID is specified.
+        """
+        repo = DjangoNotificationRepository()
+        notifications = [
+            make_notification()
+            for _ in range(2)
+        ]
+        for notification in notifications:
+            repo.create(notification)
+
+        result = repo.get_pending_for_update(notifications[1].uuid)
+
+        assert result is not None
+        assert result.uuid == notifications[1].uuid
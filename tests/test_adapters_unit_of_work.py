@@ -8,17 +8,26 @@ from notification_service.adapters.db.repositories import (
 )
 
 
-@pytest.mark.django_db
+@pytest.mark.xdist_group("db")
 class TestDjangoUnitOfWork:
     """Tests for DjangoUnitOfWork."""
 
-    def test_initialization(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def uow_instance(cls):
+        """
+        Unit of work shared by tests, which don't enter its context.
+        """
+        return DjangoUnitOfWork()
+
+    def test_initialization(self, uow_instance):
         """Test unit of work initialization."""
-        uow = DjangoUnitOfWork()
+        uow = uow_instance
 
         assert uow.notification_repo is not None
         assert isinstance(uow.notification_repo, DjangoNotificationRepository)
 
+    @pytest.mark.django_db
     def test_context_manager_enter(self):
         """Test entering unit of work context."""
         uow = DjangoUnitOfWork()
@@ -27,6 +36,7 @@ class TestDjangoUnitOfWork:
             assert context_uow is uow
             assert uow._transaction is not None
 
+    @pytest.mark.django_db
     def test_context_manager_exit_success(self):
         """Test exiting unit of work context successfully."""
         uow = DjangoUnitOfWork()
@@ -34,6 +44,7 @@ class TestDjangoUnitOfWork:
         with uow:
             pass
 
+    @pytest.mark.django_db
     def test_context_manager_exit_with_exception(self):
         """Test exiting unit of work context with exception."""
         uow = DjangoUnitOfWork()
@@ -42,6 +53,7 @@ class TestDjangoUnitOfWork:
             with uow:
                 raise ValueError("Test exception")
 
+    @pytest.mark.django_db
     def test_commit(self):
         """Test commit() method."""
         uow = DjangoUnitOfWork()
@@ -52,9 +64,9 @@ class TestDjangoUnitOfWork:
             except Exception:
                 pass
 
-    def test_rollback(self):
+    def test_rollback(self, uow_instance):
         """Test rollback() method."""
-        uow = DjangoUnitOfWork()
+        uow = uow_instance
 
         assert hasattr(uow, "rollback")
         assert callable(uow.rollback)
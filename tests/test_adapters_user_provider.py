@@ -1,15 +1,22 @@
-"""Tests for user provider adapters."""
+"""
+Tests for user provider adapters.
 
-from uuid import UUID, uuid4
-from unittest.mock import patch
+Keycloak admin client is replaced per test and provider caches are
+reset, so the tests are safe to run in parallel with pytest -n auto.
+"""
+
+from uuid import UUID
+from unittest.mock import Mock
 
 import pytest
+from cachetools import TTLCache
 from keycloak.exceptions import (
     KeycloakGetError,
     KeycloakError,
     KeycloakConnectionError,
 )
 
+from notification_service.adapters.user_provider import keycloak
 from notification_service.adapters.user_provider.local import LocalUserProvider
 from notification_service.adapters.user_provider.keycloak import (
     KeycloakUserProvider,
@@ -26,17 +33,46 @@ from notification_service.application.ports.exceptions.base import (
 )
 
 
+# Users of LocalUserProvider's storage and one, which it doesn't have.
+_LOCAL_USER = UUID(int=0)
+_ANOTHER_LOCAL_USER = UUID(int=1)
+_UNKNOWN_LOCAL_USER = UUID(int=2)
+
+
+@pytest.fixture(autouse=True)
+def reset_keycloak_provider():
+    """
+    Don't let users cached by one test or failures seen by the circuit
+    breaker leak into another.
+    """
+    KeycloakUserProvider._settings_cache.clear()
+    KeycloakUserProvider._missing_users.clear()
+    KeycloakUserProvider._breaker.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_keycloak_admin(monkeypatch):
+    """
+    Replace Keycloak admin client used by the provider with a mock
+    in every test, so none of them can reach a real Keycloak server.
+    """
+    mock = Mock(spec=["get_user"])
+    monkeypatch.setattr(keycloak, "keycloak_admin", mock)
+    return mock
+
+
 class TestLocalUserProvider:
     """Tests for LocalUserProvider."""
 
-    @pytest.fixture
-    def provider(self):
-        """Create provider instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def provider(cls):
+        """Create provider instance, shared by tests of the class."""
         return LocalUserProvider()
 
     def test_get_notification_settings_existing_user(self, provider):
         """Test getting notification settings for existing user."""
-        user_uuid = UUID("00000000-0000-0000-0000-000000000000")
+        user_uuid = _LOCAL_USER
 
         settings = provider.get_notification_settings(user_uuid)
 
@@ -50,7 +86,7 @@ class TestLocalUserProvider:
 
     def test_get_notification_settings_another_user(self, provider):
         """Test getting notification settings for another existing user."""
-        user_uuid = UUID("00000000-0000-0000-0000-000000000001")
+        user_uuid = _ANOTHER_LOCAL_USER
 
         settings = provider.get_notification_settings(user_uuid)
 
@@ -63,28 +99,31 @@ class TestLocalUserProvider:
 
     def test_get_notification_settings_user_not_found(self, provider):
         """Test getting notification settings for non-existing user."""
-        user_uuid = uuid4()
+        user_uuid = _UNKNOWN_LOCAL_USER
 
         with pytest.raises(UserNotFound):
             provider.get_notification_settings(user_uuid)
 
+    def test_local_users_are_read_only(self, provider):
+        """Test that local storage, shared by providers, can't be changed."""
+        with pytest.raises(TypeError):
+            provider._local_users[_UNKNOWN_LOCAL_USER] = None
+
 
 class TestKeycloakUserProvider:
     """Tests for KeycloakUserProvider."""
 
-    @pytest.fixture
-    def provider(self):
-        """Create provider instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def provider(cls):
+        """Create provider instance, shared by tests of the class."""
         return KeycloakUserProvider()
 
-    @patch(
-        "notification_service.adapters.user_provider.keycloak.keycloak_admin"
-    )
     def test_get_notification_settings_success(
-        self, mock_keycloak_admin, provider
+        self, mock_keycloak_admin, provider, make_uuid
     ):
         """Test getting notification settings successfully from Keycloak."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         user_data = {
             "id": str(user_uuid),
             "attributes": {
@@ -101,66 +140,126 @@ class TestKeycloakUserProvider:
         assert settings.user_uuid == user_uuid
         assert NotificationType.EMAIL in settings.notification_channels
         assert NotificationType.SMS in settings.notification_channels
+        assert (
+            settings.preferred_notification_channel is NotificationType.EMAIL
+        )
         mock_keycloak_admin.get_user.assert_called_once_with(str(user_uuid))
 
-    @patch(
-        "notification_service.adapters.user_provider.keycloak.keycloak_admin"
-    )
-    def test_get_notification_settings_user_not_found(
-        self, mock_keycloak_admin, provider
+    def test_get_notification_settings_unknown_attributes_ignored(
+        self, mock_keycloak_admin, provider, make_uuid
     ):
-        """
-        Test getting notification settings
-        when user not found in Keycloak.
-        """
-        user_uuid = uuid4()
-        mock_keycloak_admin.get_user.side_effect = KeycloakGetError(
-            "User not found"
-        )
+        """Test that unknown channels in Keycloak attributes are ignored."""
+        user_uuid = make_uuid()
+        mock_keycloak_admin.get_user.return_value = {
+            "id": str(user_uuid),
+            "attributes": {
+                "email": ["test@example.com"],
+                "fax": ["+1234567890"],
+                "preferred_notification_channel": ["fax"],
+            },
+        }
 
-        with pytest.raises(UserNotFound):
-            provider.get_notification_settings(user_uuid)
+        settings = provider.get_notification_settings(user_uuid)
+
+        assert settings.notification_channels == {
+            NotificationType.EMAIL: "test@example.com"
+        }
+        assert settings.preferred_notification_channel is None
 
-    @patch(
-        "notification_service.adapters.user_provider.keycloak.keycloak_admin"
+    @pytest.mark.parametrize(
+        "keycloak_error, expected_error",
+        [
+            pytest.param(
+                KeycloakGetError("User not found", response_code=404),
+                UserNotFound,
+                id="user_not_found",
+            ),
+            pytest.param(
+                KeycloakGetError("Forbidden", response_code=403),
+                TemporaryFailure,
+                id="forbidden",
+            ),
+            pytest.param(
+                KeycloakGetError("Internal error", response_code=500),
+                TemporaryFailure,
+                id="server_error",
+            ),
+            pytest.param(
+                KeycloakConnectionError("Connection failed"),
+                TemporaryFailure,
+                id="connection_error",
+            ),
+            pytest.param(
+                KeycloakError("Keycloak error"),
+                TemporaryFailure,
+                id="keycloak_error",
+            ),
+        ],
     )
-    def test_get_notification_settings_connection_error(
-        self, mock_keycloak_admin, provider
+    def test_get_notification_settings_keycloak_failure(
+        self,
+        mock_keycloak_admin,
+        provider,
+        make_uuid,
+        keycloak_error,
+        expected_error,
     ):
-        """
-        Test getting notification settings when Keycloak connection fails.
-        """
-        user_uuid = uuid4()
-        mock_keycloak_admin.get_user.side_effect = KeycloakConnectionError(
-            "Connection failed"
-        )
+        """Test mapping of Keycloak errors to user provider errors."""
+        mock_keycloak_admin.get_user.side_effect = keycloak_error
 
-        with pytest.raises(TemporaryFailure):
-            provider.get_notification_settings(user_uuid)
+        with pytest.raises(expected_error):
+            provider.get_notification_settings(make_uuid())
 
-    @patch(
-        "notification_service.adapters.user_provider.keycloak.keycloak_admin"
+    @pytest.mark.parametrize(
+        "keycloak_error",
+        [
+            pytest.param(
+                KeycloakConnectionError("Connection failed"),
+                id="connection_error",
+            ),
+            pytest.param(
+                KeycloakGetError("Service unavailable", response_code=503),
+                id="server_error",
+            ),
+        ],
     )
-    def test_get_notification_settings_keycloak_error(
-        self, mock_keycloak_admin, provider
+    def test_get_notification_settings_circuit_opens(
+        self, mock_keycloak_admin, provider, make_uuid, keycloak_error
     ):
-        """Test getting notification settings when Keycloak error occurs."""
-        user_uuid = uuid4()
-        mock_keycloak_admin.get_user.side_effect = KeycloakError(
-            "Keycloak error"
+        """Test that Keycloak isn't called after repeated failures."""
+        mock_keycloak_admin.get_user.side_effect = keycloak_error
+
+        for _ in range(KeycloakUserProvider.BREAKER_FAIL_MAX + 1):
+            with pytest.raises(TemporaryFailure):
+                provider.get_notification_settings(make_uuid())
+
+        assert (
+            mock_keycloak_admin.get_user.call_count
+            == KeycloakUserProvider.BREAKER_FAIL_MAX
         )
 
-        with pytest.raises(TemporaryFailure):
-            provider.get_notification_settings(user_uuid)
+    def test_get_notification_settings_missing_user_keeps_circuit_closed(
+        self, mock_keycloak_admin, provider, make_uuid
+    ):
+        """Test that missing users aren't counted as Keycloak failures."""
+        mock_keycloak_admin.get_user.side_effect = KeycloakGetError(
+            "User not found", response_code=404
+        )
+
+        for _ in range(KeycloakUserProvider.BREAKER_FAIL_MAX + 1):
+            with pytest.raises(UserNotFound):
+                provider.get_notification_settings(make_uuid())
+
+        assert (
+            mock_keycloak_admin.get_user.call_count
+            == KeycloakUserProvider.BREAKER_FAIL_MAX + 1
+        )
 
-    @patch(
-        "notification_service.adapters.user_provider.keycloak.keycloak_admin"
-    )
     def test_get_notification_settings_no_attributes(
-        self, mock_keycloak_admin, provider
+        self, mock_keycloak_admin, provider, make_uuid
     ):
         """Test getting notification settings when user has no attributes."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         user_data = {"id": str(user_uuid), "attributes": {}}
         mock_keycloak_admin.get_user.return_value = user_data
 
@@ -170,3 +269,193 @@ class TestKeycloakUserProvider:
         assert settings.user_uuid == user_uuid
         assert len(settings.notification_channels) == 0
         assert settings.preferred_notification_channel is None
+
+    def test_user_to_settings_ignores_other_attributes(self, make_uuid):
+        """
+        Test that attributes, which aren't notification channels,
+        such as the ones federated from LDAP, are ignored.
+        """
+        user_uuid = make_uuid()
+        attributes = {f"ldap_attribute_{i}": ["value"] for i in range(50)}
+        attributes["email"] = ["test@example.com"]
+
+        settings = KeycloakUserProvider._user_to_settings(
+            user_uuid, {"id": str(user_uuid), "attributes": attributes}
+        )
+
+        assert settings.notification_channels == {
+            NotificationType.EMAIL: "test@example.com"
+        }
+
+    def test_user_to_settings_benchmark(self, benchmark, make_uuid):
+        """
+        Benchmark conversion of Keycloak user to notification settings.
+        Runs once by default, measure it with
+        pytest --dist=no --benchmark-enable -k benchmark.
+        """
+        user_uuid = make_uuid()
+        user_data = {
+            "id": str(user_uuid),
+            "attributes": {
+                "email": ["test@example.com"],
+                "sms": ["+1234567890"],
+                "locale": ["en"],
+                "preferred_notification_channel": ["sms"],
+            },
+        }
+
+        settings = benchmark(
+            KeycloakUserProvider._user_to_settings, user_uuid, user_data
+        )
+
+        assert settings.notification_channels == {
+            NotificationType.EMAIL: "test@example.com",
+            NotificationType.SMS: "+1234567890",
+        }
+        assert settings.preferred_notification_channel is NotificationType.SMS
+
+
+class TestKeycloakUserProviderCache:
+    """Tests for caching of settings in KeycloakUserProvider."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """
+        Replace provider caches with the ones using controllable time.
+        Returns list with the current time, which tests can change.
+        """
+        now = [0.0]
+        for name, ttl in (
+            ("_settings_cache", KeycloakUserProvider.SETTINGS_TTL),
+            ("_missing_users", KeycloakUserProvider.MISSING_USER_TTL),
+        ):
+            monkeypatch.setattr(
+                KeycloakUserProvider,
+                name,
+                TTLCache(maxsize=1024, ttl=ttl, timer=lambda: now[0]),
+            )
+        return now
+
+    @pytest.fixture
+    def user_uuid(self, make_uuid):
+        """UUID of the user to look up."""
+        return make_uuid()
+
+    @pytest.fixture
+    def user_data(self, user_uuid):
+        """Keycloak representation of the user."""
+        return {
+            "id": str(user_uuid),
+            "attributes": {"email": ["test@example.com"]},
+        }
+
+    def test_repeated_lookup_uses_cache(
+        self, mock_keycloak_admin, clock, user_uuid, user_data
+    ):
+        """Test that user is fetched from Keycloak once."""
+        mock_keycloak_admin.get_user.return_value = user_data
+        provider = KeycloakUserProvider()
+
+        first = provider.get_notification_settings(user_uuid)
+        second = KeycloakUserProvider().get_notification_settings(
+            user_uuid=user_uuid
+        )
+
+        assert second is first
+        assert mock_keycloak_admin.get_user.call_count == 1
+
+    def test_cached_settings_expire(
+        self, mock_keycloak_admin, clock, user_uuid, user_data
+    ):
+        """Test that user is fetched again after TTL has passed."""
+        mock_keycloak_admin.get_user.return_value = user_data
+        provider = KeycloakUserProvider()
+
+        provider.get_notification_settings(user_uuid)
+        clock[0] += KeycloakUserProvider.SETTINGS_TTL + 1
+        provider.get_notification_settings(user_uuid)
+
+        assert mock_keycloak_admin.get_user.call_count == 2
+
+    def test_failed_lookup_is_not_cached(
+        self, mock_keycloak_admin, clock, user_uuid, user_data
+    ):
+        """Test that errors from Keycloak are not cached."""
+        mock_keycloak_admin.get_user.side_effect = [
+            KeycloakConnectionError("Connection failed"),
+            user_data,
+        ]
+        provider = KeycloakUserProvider()
+
+        with pytest.raises(TemporaryFailure):
+            provider.get_notification_settings(user_uuid)
+        settings = provider.get_notification_settings(user_uuid)
+
+        assert settings.user_uuid == user_uuid
+        assert mock_keycloak_admin.get_user.call_count == 2
+
+    def test_missing_user_is_cached(
+        self, mock_keycloak_admin, clock, user_uuid
+    ):
+        """Test that user, which wasn't found, isn't fetched again."""
+        mock_keycloak_admin.get_user.side_effect = KeycloakGetError(
+            "User not found", response_code=404
+        )
+        provider = KeycloakUserProvider()
+
+        for _ in range(2):
+            with pytest.raises(UserNotFound):
+                provider.get_notification_settings(user_uuid)
+
+        assert mock_keycloak_admin.get_user.call_count == 1
+
+    def test_missing_user_expires(
+        self, mock_keycloak_admin, clock, user_uuid, user_data
+    ):
+        """Test that missing user is fetched again after TTL has passed."""
+        mock_keycloak_admin.get_user.side_effect = [
+            KeycloakGetError("User not found", response_code=404),
+            user_data,
+        ]
+        provider = KeycloakUserProvider()
+
+        with pytest.raises(UserNotFound):
+            provider.get_notification_settings(user_uuid)
+        clock[0] += KeycloakUserProvider.MISSING_USER_TTL + 1
+        settings = provider.get_notification_settings(user_uuid)
+
+        assert settings.user_uuid == user_uuid
+        assert mock_keycloak_admin.get_user.call_count == 2
+
+    def test_missing_user_response_is_cached(
+        self, mock_keycloak_admin, clock, user_uuid
+    ):
+        """Test that only 404 from Keycloak marks user as missing."""
+        mock_keycloak_admin.get_user.side_effect = KeycloakGetError(
+            "User not found", response_code=404
+        )
+
+        with pytest.raises(UserNotFound):
+            KeycloakUserProvider().get_notification_settings(user_uuid)
+
+        assert user_uuid in KeycloakUserProvider._missing_users
+        assert user_uuid not in KeycloakUserProvider._settings_cache
+
+    def test_server_error_response_is_not_cached(
+        self, mock_keycloak_admin, clock, user_uuid, user_data
+    ):
+        """Test that user is fetched again after Keycloak server error."""
+        mock_keycloak_admin.get_user.side_effect = [
+            KeycloakGetError("Internal error", response_code=500),
+            user_data,
+        ]
+        provider = KeycloakUserProvider()
+
+        with pytest.raises(TemporaryFailure):
+            provider.get_notification_settings(user_uuid)
+        assert user_uuid not in KeycloakUserProvider._missing_users
+        assert user_uuid not in KeycloakUserProvider._settings_cache
+        settings = provider.get_notification_settings(user_uuid)
+
+        assert settings.user_uuid == user_uuid
+        assert mock_keycloak_admin.get_user.call_count == 2
@@ -1,6 +1,6 @@
 """Tests for application DTOs."""
 
-from uuid import uuid4
+from dataclasses import FrozenInstanceError
 
 import pytest
 
@@ -20,9 +20,9 @@ from notification_service.domain.enums import (
 class TestNotificationStatusDTO:
     """Tests for NotificationStatusDTO."""
 
-    def test_notification_status_dto_creation(self):
+    def test_notification_status_dto_creation(self, make_uuid):
         """Test creating a NotificationStatusDTO."""
-        uuid = uuid4()
+        uuid = make_uuid()
         dto = NotificationStatusDTO(
             uuid=uuid, status=NotificationStatus.PENDING, was_created=True
         )
@@ -31,34 +31,22 @@ class TestNotificationStatusDTO:
         assert dto.status == NotificationStatus.PENDING
         assert dto.was_created is True
 
-    def test_notification_status_dto_immutability(self):
-        """Test that DTO is frozen (immutable)."""
-        from dataclasses import FrozenInstanceError
-
-        uuid = uuid4()
-        dto = NotificationStatusDTO(
-            uuid=uuid, status=NotificationStatus.SENT, was_created=False
-        )
-
-        with pytest.raises(FrozenInstanceError):
-            dto.was_created = True
-
 
 class TestAuthContext:
     """Tests for AuthContext."""
 
-    def test_auth_context_creation(self):
+    def test_auth_context_creation(self, make_uuid):
         """Test creating an AuthContext."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         scopes = {"read", "write"}
         auth_context = AuthContext(user_uuid=user_uuid, scopes=scopes)
 
         assert auth_context.user_uuid == user_uuid
         assert auth_context.scopes == scopes
 
-    def test_auth_context_has_scope(self):
+    def test_auth_context_has_scope(self, make_uuid):
         """Test has() method for scope checking."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         scopes = {"read", "write", "admin"}
         auth_context = AuthContext(user_uuid=user_uuid, scopes=scopes)
 
@@ -67,23 +55,13 @@ class TestAuthContext:
         assert auth_context.has("admin") is True
         assert auth_context.has("delete") is False
 
-    def test_auth_context_immutability(self):
-        """Test that AuthContext is frozen."""
-        from dataclasses import FrozenInstanceError
-
-        user_uuid = uuid4()
-        auth_context = AuthContext(user_uuid=user_uuid, scopes={"read"})
-
-        with pytest.raises(FrozenInstanceError):
-            auth_context.scopes = {"write"}
-
 
 class TestUserNotificationsSettings:
     """Tests for UserNotificationsSettings."""
 
-    def test_user_notifications_settings_creation(self):
+    def test_user_notifications_settings_creation(self, make_uuid):
         """Test creating UserNotificationsSettings."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         channels = {
             NotificationType.EMAIL: "test@example.com",
             NotificationType.SMS: "+1234567890",
@@ -100,9 +78,9 @@ class TestUserNotificationsSettings:
             settings.preferred_notification_channel == NotificationType.EMAIL
         )
 
-    def test_user_notifications_settings_without_preferred(self):
+    def test_user_notifications_settings_without_preferred(self, make_uuid):
         """Test UserNotificationsSettings without preferred channel."""
-        user_uuid = uuid4()
+        user_uuid = make_uuid()
         channels = {NotificationType.PUSH: "token123"}
         settings = UserNotificationsSettings(
             user_uuid=user_uuid,
@@ -112,16 +90,46 @@ class TestUserNotificationsSettings:
 
         assert settings.preferred_notification_channel is None
 
-    def test_user_notifications_settings_immutability(self):
-        """Test that UserNotificationsSettings is frozen."""
-        from dataclasses import FrozenInstanceError
 
-        user_uuid = uuid4()
-        settings = UserNotificationsSettings(
-            user_uuid=user_uuid,
-            notification_channels={NotificationType.EMAIL: "test@example.com"},
-            preferred_notification_channel=NotificationType.EMAIL,
-        )
+class TestDTOImmutability:
+    """Tests, which check that DTOs are frozen."""
+
+    @pytest.mark.parametrize(
+        "make_dto, field, value",
+        [
+            pytest.param(
+                lambda uuid: NotificationStatusDTO(
+                    uuid=uuid,
+                    status=NotificationStatus.SENT,
+                    was_created=False,
+                ),
+                "was_created",
+                True,
+                id="notification_status_dto",
+            ),
+            pytest.param(
+                lambda uuid: AuthContext(user_uuid=uuid, scopes={"read"}),
+                "scopes",
+                {"write"},
+                id="auth_context",
+            ),
+            pytest.param(
+                lambda uuid: UserNotificationsSettings(
+                    user_uuid=uuid,
+                    notification_channels={
+                        NotificationType.EMAIL: "test@example.com"
+                    },
+                    preferred_notification_channel=NotificationType.EMAIL,
+                ),
+                "preferred_notification_channel",
+                NotificationType.SMS,
+                id="user_notifications_settings",
+            ),
+        ],
+    )
+    def test_dto_is_frozen(self, make_dto, field, value, make_uuid):
+        """Test that DTO fields can't be changed."""
+        dto = make_dto(make_uuid())
 
         with pytest.raises(FrozenInstanceError):
-            settings.preferred_notification_channel = NotificationType.SMS
+            setattr(dto, field, value)
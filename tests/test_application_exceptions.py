@@ -1,5 +1,7 @@
 """Tests for application exceptions."""
 
+import pytest
+
 from notification_service.application.ports.exceptions.base import (
     NotificationServiceError,
     TemporaryFailure,
@@ -20,6 +22,66 @@ from notification_service.application.ports.exceptions.workers import (
 )
 
 
+EXCEPTION_CASES = [
+    pytest.param(
+        RepositoryError,
+        (NotificationServiceError,),
+        None,
+        id="repository_error",
+    ),
+    pytest.param(
+        ObjectNotFoundInRepository,
+        (RepositoryError, NotificationServiceError),
+        "not found",
+        id="object_not_found",
+    ),
+    pytest.param(
+        UserProviderError,
+        (NotificationServiceError,),
+        None,
+        id="user_provider_error",
+    ),
+    pytest.param(
+        UserNotFound,
+        (UserProviderError, NotificationServiceError),
+        "not found",
+        id="user_not_found",
+    ),
+    pytest.param(
+        NotificationWorkerError,
+        (NotificationServiceError,),
+        None,
+        id="notification_worker_error",
+    ),
+    pytest.param(
+        NotificationChannelError,
+        (NotificationWorkerError, NotificationServiceError),
+        None,
+        id="notification_channel_error",
+    ),
+    pytest.param(
+        UserDoesntHaveTheChannel,
+        (
+            NotificationChannelError,
+            NotificationWorkerError,
+            NotificationServiceError,
+        ),
+        None,
+        id="user_doesnt_have_the_channel",
+    ),
+    pytest.param(
+        CouldntSendNotification,
+        (
+            NotificationChannelError,
+            NotificationWorkerError,
+            NotificationServiceError,
+        ),
+        None,
+        id="couldnt_send_notification",
+    ),
+]
+
+
 class TestNotificationServiceError:
     """Tests for base NotificationServiceError."""
 
@@ -31,10 +93,13 @@ class TestNotificationServiceError:
             == "There was an error in the notification service workflow."
         )
 
-    def test_custom_message(self):
+    @pytest.mark.parametrize(
+        "exception_class", [NotificationServiceError, NotificationWorkerError]
+    )
+    def test_custom_message(self, exception_class):
         """Test exception with custom message."""
         custom_msg = "Custom error message"
-        error = NotificationServiceError(custom_msg)
+        error = exception_class(custom_msg)
         assert str(error) == custom_msg
 
 
@@ -47,93 +112,17 @@ class TestTemporaryFailure:
         assert str(error) == "Temporary failure in executing."
 
 
-class TestRepositoryError:
-    """Tests for repository exceptions."""
-
-    def test_repository_error_inheritance(self):
-        """Test that RepositoryError inherits from NotificationServiceError."""
-        error = RepositoryError()
-        assert isinstance(error, NotificationServiceError)
-
-    def test_object_not_found_inheritance(self):
-        """
-        Test that ObjectNotFoundInRepository inherits from RepositoryError.
-        """
-        error = ObjectNotFoundInRepository()
-        assert isinstance(error, RepositoryError)
-        assert isinstance(error, NotificationServiceError)
-
-    def test_object_not_found_message(self):
-        """Test ObjectNotFoundInRepository message."""
-        error = ObjectNotFoundInRepository()
-        assert "not found" in str(error).lower()
-
-
-class TestUserProviderError:
-    """Tests for user provider exceptions."""
-
-    def test_user_provider_error_inheritance(self):
-        """T
-        est that UserProviderError inherits from NotificationServiceError.
-        """
-        error = UserProviderError()
-        assert isinstance(error, NotificationServiceError)
-
-    def test_user_not_found_inheritance(self):
-        """Test that UserNotFound inherits from UserProviderError."""
-        error = UserNotFound()
-        assert isinstance(error, UserProviderError)
-        assert isinstance(error, NotificationServiceError)
-
-    def test_user_not_found_message(self):
-        """Test UserNotFound message."""
-        error = UserNotFound()
-        assert "not found" in str(error).lower()
+class TestExceptionContract:
+    """Tests for hierarchy and default messages of exceptions."""
 
-
-class TestNotificationWorkerError:
-    """Tests for worker exceptions."""
-
-    def test_notification_worker_error_inheritance(self):
-        """
-        Test that NotificationWorkerError inherits
-        from NotificationServiceError.
-        """
-        error = NotificationWorkerError()
-        assert isinstance(error, NotificationServiceError)
-
-    def test_notification_channel_error_inheritance(self):
-        """
-        Test that NotificationChannelError inherits
-        from NotificationWorkerError.
-        """
-        error = NotificationChannelError()
-        assert isinstance(error, NotificationWorkerError)
-        assert isinstance(error, NotificationServiceError)
-
-    def test_user_doesnt_have_channel_inheritance(self):
-        """
-        Test that UserDoesntHaveTheChannel inherits
-        from NotificationChannelError.
-        """
-        error = UserDoesntHaveTheChannel()
-        assert isinstance(error, NotificationChannelError)
-        assert isinstance(error, NotificationWorkerError)
-        assert isinstance(error, NotificationServiceError)
-
-    def test_couldnt_send_notification_inheritance(self):
+    @pytest.mark.parametrize(
+        "exception_class, bases, message", EXCEPTION_CASES
+    )
+    def test_exception_contract(self, exception_class, bases, message):
         """
-        Test that CouldntSendNotification inherits
-        from NotificationChannelError.
+        Test that exception inherits from its base exceptions
+        and its default message matches the expected pattern.
         """
-        error = CouldntSendNotification()
-        assert isinstance(error, NotificationChannelError)
-        assert isinstance(error, NotificationWorkerError)
-        assert isinstance(error, NotificationServiceError)
-
-    def test_custom_messages(self):
-        """Test custom messages for worker exceptions."""
-        custom_msg = "Custom worker error"
-        error = NotificationWorkerError(custom_msg)
-        assert str(error) == custom_msg
-
+        with pytest.raises(exception_class, match=message) as excinfo:
+            raise exception_class()
+        assert set(bases) <= set(type(excinfo.value).__mro__)
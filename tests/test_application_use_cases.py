@@ -1,6 +1,7 @@
 """Tests for application use cases."""
 
-from uuid import uuid4
+from uuid import UUID
+from dataclasses import replace
 from unittest.mock import Mock
 
 import pytest
@@ -9,74 +10,133 @@ from notification_service.application.use_cases.send_notification import (
     SendNotificationUseCase,
 )
 from notification_service.domain.entities import Notification
-from notification_service.domain.enums import (
-    NotificationStatus,
-    NotificationType,
-)
+from notification_service.domain.enums import NotificationStatus
 from notification_service.application.dtos.notification_status import (
     NotificationStatusDTO,
 )
+from notification_service.application.ports.repositories import (
+    NotificationRepositoryPort,
+)
+from notification_service.application.ports.unit_of_work import (
+    UnitOfWorkPort,
+)
+
+
+class FakeNotificationRepository(NotificationRepositoryPort):
+    """In-memory notification repository, which records its calls."""
+
+    def __init__(self):
+        self.notifications: dict[UUID, Notification] = {}
+        self.calls: list[tuple[str, object]] = []
+
+    def exists(self, uuid: UUID) -> bool:
+        self.calls.append(("exists", uuid))
+        return uuid in self.notifications
+
+    def create(self, notification: Notification) -> Notification:
+        self.calls.append(("create", notification))
+        self.notifications[notification.uuid] = notification
+        return notification
+
+    def create_or_get(
+            self,
+            notification: Notification
+    ) -> tuple[Notification, bool]:
+        self.calls.append(("create_or_get", notification))
+        if notification.uuid in self.notifications:
+            return self.notifications[notification.uuid], False
+        self.notifications[notification.uuid] = notification
+        return notification, True
+
+    def update(self, notification: Notification) -> Notification:
+        self.calls.append(("update", notification))
+        self.notifications[notification.uuid] = notification
+        return notification
+
+    def get_by_uuid(self, uuid: UUID) -> Notification | None:
+        self.calls.append(("get_by_uuid", uuid))
+        return self.notifications.get(uuid)
+
+    def get_pending_for_update(
+            self,
+            uuid: UUID | None = None
+    ) -> Notification | None:
+        self.calls.append(("get_pending_for_update", uuid))
+        return next(
+            (
+                notification
+                for notification in self.notifications.values()
+                if notification.status == NotificationStatus.PENDING
+                and uuid in (None, notification.uuid)
+            ),
+            None
+        )
+
+
+class FakeUnitOfWork(UnitOfWorkPort):
+    """Unit of work over the in-memory notification repository."""
+
+    def __init__(self):
+        self.notification_repo = FakeNotificationRepository()
+        self.committed = False
+
+    def __enter__(self) -> "FakeUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.commit()
 
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.committed = False
 
 
 class TestSendNotificationUseCase:
     """Tests for SendNotificationUseCase."""
 
     @pytest.fixture
-    def mock_uow(self):
-        """Create a mock unit of work."""
-        uow = Mock()
-        uow.notification_repo = Mock()
-        uow.__enter__ = Mock(return_value=uow)
-        uow.__exit__ = Mock(return_value=None)
-        return uow
+    def uow(self):
+        """Create a fake unit of work with an empty repository."""
+        return FakeUnitOfWork()
 
     @pytest.fixture
-    def use_case(self, mock_uow):
+    def use_case(self, uow):
         """Create a SendNotificationUseCase instance."""
-        return SendNotificationUseCase(mock_uow)
+        return SendNotificationUseCase(uow)
 
     @pytest.fixture
-    def notification(self):
+    def notification(self, make_notification):
         """Create a test notification."""
-        return Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=NotificationType.EMAIL,
-            status=NotificationStatus.PENDING,
-        )
+        return make_notification()
 
-    def test_execute_new_notification(self, use_case, mock_uow, notification):
+    def test_execute_new_notification(self, use_case, uow, notification):
         """Test executing use case for a new notification."""
-        mock_uow.notification_repo.exists.return_value = False
-        mock_uow.notification_repo.create.return_value = notification
-
         result = use_case.execute(notification)
 
         assert isinstance(result, NotificationStatusDTO)
         assert result.uuid == notification.uuid
         assert result.status == notification.status
         assert result.was_created is True
-        mock_uow.notification_repo.exists.assert_called_once_with(
-            notification.uuid
-        )
-        mock_uow.notification_repo.create.assert_called_once_with(notification)
+        assert uow.notification_repo.notifications == {
+            notification.uuid: notification
+        }
 
     def test_execute_existing_notification(
-        self, use_case, mock_uow, notification
+        self, use_case, uow, notification, make_notification
     ):
         """Test executing use case for an existing notification."""
-        existing_notification = Notification(
+        existing_notification = make_notification(
             uuid=notification.uuid,
             user_uuid=notification.user_uuid,
             title="Existing Title",
             text="Existing Text",
             status=NotificationStatus.SENT,
+            type=None,
         )
-        mock_uow.notification_repo.exists.return_value = True
-        mock_uow.notification_repo.get_by_uuid.return_value = (
+        uow.notification_repo.notifications[notification.uuid] = (
             existing_notification
         )
 
@@ -86,40 +146,71 @@ class TestSendNotificationUseCase:
         assert result.uuid == existing_notification.uuid
         assert result.status == existing_notification.status
         assert result.was_created is False
-        mock_uow.notification_repo.exists.assert_called_once_with(
-            notification.uuid
-        )
-        mock_uow.notification_repo.get_by_uuid.assert_called_once_with(
-            notification.uuid
-        )
-        mock_uow.notification_repo.create.assert_not_called()
+        assert uow.notification_repo.notifications == {
+            notification.uuid: existing_notification
+        }
 
-    def test_execute_uses_context_manager(
-        self, use_case, mock_uow, notification
+    def test_execute_makes_single_repository_call(
+        self, use_case, uow, notification
     ):
-        """Test that use case uses unit of work as context manager."""
-        mock_uow.notification_repo.exists.return_value = False
-        mock_uow.notification_repo.create.return_value = notification
-
+        """Test that use case doesn't check existence separately."""
         use_case.execute(notification)
 
-        mock_uow.__enter__.assert_called_once()
-        mock_uow.__exit__.assert_called_once()
+        assert uow.notification_repo.calls == [
+            ("create_or_get", notification)
+        ]
 
-    def test_execute_with_none_type(self, use_case, mock_uow):
+    def test_execute_with_none_type(self, use_case, make_notification):
         """Test executing use case with notification type None."""
-        notification = Notification(
-            uuid=uuid4(),
-            user_uuid=uuid4(),
-            title="Test Title",
-            text="Test Text",
-            type=None,
-        )
-        mock_uow.notification_repo.exists.return_value = False
-        mock_uow.notification_repo.create.return_value = notification
+        notification = make_notification(type=None)
 
         result = use_case.execute(notification)
 
         assert result.uuid == notification.uuid
         assert result.was_created is True
 
+    def test_execute_caches_final_status(self, use_case, uow, notification):
+        """Test that repeated sends of a processed notification skip DB."""
+        uow.notification_repo.notifications[notification.uuid] = replace(
+            notification, status=NotificationStatus.SENT
+        )
+
+        use_case.execute(notification)
+        result = use_case.execute(notification)
+
+        assert result.status == NotificationStatus.SENT
+        assert result.was_created is False
+        assert len(uow.notification_repo.calls) == 1
+
+    def test_execute_does_not_cache_pending_status(
+        self, use_case, uow, notification
+    ):
+        """Test that pending notifications are always fetched from DB."""
+        use_case.execute(notification)
+        use_case.execute(notification)
+
+        assert uow.notification_repo.calls == [
+            ("create_or_get", notification),
+            ("create_or_get", notification),
+        ]
+
+    def test_execute_dispatches_new_notification(self, uow, notification):
+        """Test that created notification is handed over to dispatcher."""
+        dispatcher = Mock()
+        use_case = SendNotificationUseCase(uow, dispatcher)
+
+        use_case.execute(notification)
+
+        dispatcher.dispatch.assert_called_once_with(notification)
+
+    def test_execute_does_not_dispatch_existing_notification(
+        self, uow, notification
+    ):
+        """Test that existing notification is not dispatched again."""
+        dispatcher = Mock()
+        use_case = SendNotificationUseCase(uow, dispatcher)
+        uow.notification_repo.notifications[notification.uuid] = notification
+
+        use_case.execute(notification)
+
+        dispatcher.dispatch.assert_not_called()
@@ -0,0 +1,108 @@
+"""Tests for Keycloak client configuration."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from jwcrypto import jwk, jwt
+
+from notification_service.config import keycloak
+from notification_service.config.keycloak import CachingKeycloakOpenID
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    """Create RSA key to sign test tokens with."""
+    return jwk.JWK.generate(kty="RSA", size=2048)
+
+
+@pytest.fixture
+def public_key(signing_key):
+    """Realm public key in the format returned by Keycloak."""
+    pem = signing_key.export_to_pem().decode()
+    return "".join(pem.strip().splitlines()[1:-1])
+
+
+@pytest.fixture
+def client():
+    """Create a caching Keycloak OpenID client."""
+    return CachingKeycloakOpenID(
+        server_url="http://localhost:8080",
+        realm_name="test",
+        client_id="test",
+    )
+
+
+def make_token(signing_key, exp):
+    """Create signed token with the given expiration time."""
+    token = jwt.JWT(
+        header={"alg": "RS256"},
+        claims={"sub": "user", "exp": exp},
+    )
+    token.make_signed_token(signing_key)
+    return token.serialize()
+
+
+class TestCachingKeycloakOpenID:
+    """Tests for CachingKeycloakOpenID."""
+
+    def test_decode_token_fetches_public_key_once(
+        self, client, signing_key, public_key
+    ):
+        """Test that realm public key is not fetched for every token."""
+        first = make_token(signing_key, int(time.time()) + 300)
+        second = make_token(signing_key, int(time.time()) + 301)
+
+        with patch.object(
+            client, "public_key", return_value=public_key
+        ) as mock_public_key:
+            assert client.decode_token(first)["sub"] == "user"
+            assert client.decode_token(second)["sub"] == "user"
+
+        mock_public_key.assert_called_once()
+
+    def test_decode_token_uses_cached_claims(
+        self, client, signing_key, public_key
+    ):
+        """Test that repeated token is not verified again."""
+        token = make_token(signing_key, int(time.time()) + 300)
+
+        with patch.object(client, "public_key", return_value=public_key):
+            claims = client.decode_token(token)
+            with patch.object(
+                CachingKeycloakOpenID, "_verify_token"
+            ) as mock_verify:
+                assert client.decode_token(token) == claims
+
+        mock_verify.assert_not_called()
+
+    def test_decode_token_ignores_expired_cached_claims(
+        self, client, signing_key, public_key
+    ):
+        """Test that cached claims are not used after token expiration."""
+        token = make_token(signing_key, int(time.time()) + 300)
+
+        with patch.object(client, "public_key", return_value=public_key):
+            client.decode_token(token)
+            with patch(
+                "notification_service.config.keycloak.time.time",
+                return_value=time.time() + 301,
+            ), patch.object(
+                CachingKeycloakOpenID,
+                "_verify_token",
+                return_value={"sub": "user"},
+            ) as mock_verify:
+                client.decode_token(token)
+
+        mock_verify.assert_called_once()
+
+
+@pytest.mark.parametrize("client_name", ["keycloak_openid", "keycloak_admin"])
+def test_client_connection_pool(client_name):
+    """Test that Keycloak clients use configured pool size and retries."""
+    connection = getattr(keycloak, client_name).connection
+
+    adapter = connection._s.get_adapter(settings.JWT_KEYCLOAK_URL)
+    assert connection.pool_maxsize == settings.JWT_KEYCLOAK_POOL_MAXSIZE
+    assert adapter.max_retries.total == settings.JWT_KEYCLOAK_MAX_RETRIES
@@ -1,6 +1,8 @@
 """Tests for domain entities."""
 
-from uuid import uuid4
+from dataclasses import FrozenInstanceError
+
+import pytest
 
 from notification_service.domain.entities import Notification
 from notification_service.domain.enums import (
@@ -12,10 +14,10 @@ from notification_service.domain.enums import (
 class TestNotification:
     """Tests for Notification entity."""
 
-    def test_notification_creation(self):
+    def test_notification_creation(self, make_uuid):
         """Test creating a notification with all fields."""
-        uuid = uuid4()
-        user_uuid = uuid4()
+        uuid = make_uuid()
+        user_uuid = make_uuid()
         notification = Notification(
             uuid=uuid,
             user_uuid=user_uuid,
@@ -32,10 +34,10 @@ class TestNotification:
         assert notification.type == NotificationType.EMAIL
         assert notification.status == NotificationStatus.PENDING
 
-    def test_notification_defaults(self):
+    def test_notification_defaults(self, make_uuid):
         """Test notification with default values."""
-        uuid = uuid4()
-        user_uuid = uuid4()
+        uuid = make_uuid()
+        user_uuid = make_uuid()
         notification = Notification(
             uuid=uuid,
             user_uuid=user_uuid,
@@ -46,31 +48,15 @@ class TestNotification:
         assert notification.type is None
         assert notification.status == NotificationStatus.PENDING
 
-    def test_notification_with_none_type(self):
+    def test_notification_with_none_type(self, make_notification):
         """Test notification with None type."""
-        uuid = uuid4()
-        user_uuid = uuid4()
-        notification = Notification(
-            uuid=uuid,
-            user_uuid=user_uuid,
-            title="Test Title",
-            text="Test Text",
-            type=None,
-        )
+        notification = make_notification(type=None)
 
         assert notification.type is None
 
-    def test_notification_immutability(self):
-        """Test that notification fields can be accessed."""
-        uuid = uuid4()
-        user_uuid = uuid4()
-        notification = Notification(
-            uuid=uuid,
-            user_uuid=user_uuid,
-            title="Test Title",
-            text="Test Text",
-        )
-
-        assert notification.uuid == uuid
-        assert notification.user_uuid == user_uuid
+    def test_notification_immutability(self, make_notification):
+        """Test that notification fields can be accessed but not changed."""
+        notification = make_notification()
 
+        with pytest.raises(FrozenInstanceError):
+            notification.status = NotificationStatus.SENT
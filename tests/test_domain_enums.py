@@ -5,59 +5,57 @@ import pytest
 from notification_service.domain.enums import (
     NotificationType,
     NotificationStatus,
+    TERMINAL_STATUSES,
 )
 
 
-class TestNotificationType:
-    """Tests for NotificationType enum."""
-
-    def test_notification_type_values(self):
-        """Test that NotificationType has correct values."""
-        assert NotificationType.EMAIL == "email"
-        assert NotificationType.SMS == "sms"
-        assert NotificationType.PUSH == "push"
-        assert NotificationType.TELEGRAM == "telegram"
-        assert isinstance(NotificationType.EMAIL, str)
-
-    def test_notification_type_membership(self):
-        """Test membership checks."""
-        assert NotificationType.EMAIL in NotificationType
-        assert NotificationType("email") == NotificationType.EMAIL
-        assert NotificationType("email") in NotificationType
+ENUM_VALUES = [
+    pytest.param(
+        NotificationType,
+        {
+            "EMAIL": "email",
+            "SMS": "sms",
+            "PUSH": "push",
+            "TELEGRAM": "telegram",
+        },
+        id="notification_type",
+    ),
+    pytest.param(
+        NotificationStatus,
+        {
+            "PENDING": "pending",
+            "SENT": "sent",
+            "FAILED": "failed",
+        },
+        id="notification_status",
+    ),
+]
+
+
+@pytest.mark.parametrize("enum_class, values", ENUM_VALUES)
+class TestEnumContract:
+    """Tests for members and values of domain enums."""
+
+    def test_enum_values(self, enum_class, values):
+        """Test that enum has exactly the expected string members."""
+        assert {member.name: member for member in enum_class} == values
+        assert all(isinstance(member, str) for member in enum_class)
+
+    def test_enum_lookup(self, enum_class, values):
+        """Test getting enum members by their values."""
+        for name, value in values.items():
+            assert enum_class(value) is enum_class[name]
         with pytest.raises(ValueError):
-            NotificationType("invalid")
-
-    def test_notification_type_iteration(self):
-        """Test iterating over NotificationType."""
-        types = list(NotificationType)
-        assert len(types) == 4
-        assert NotificationType.EMAIL in types
-        assert NotificationType.SMS in types
-        assert NotificationType.PUSH in types
-        assert NotificationType.TELEGRAM in types
+            enum_class("invalid")
 
 
 class TestNotificationStatus:
     """Tests for NotificationStatus enum."""
 
-    def test_notification_status_values(self):
-        """Test that NotificationStatus has correct values."""
-        assert NotificationStatus.PENDING == "pending"
-        assert NotificationStatus.SENT == "sent"
-        assert NotificationStatus.FAILED == "failed"
-
-    def test_notification_status_membership(self):
-        """Test membership checks."""
-        assert NotificationStatus.PENDING in NotificationStatus
-        assert NotificationStatus("pending") == NotificationStatus.PENDING
-        assert NotificationStatus("pending") in NotificationStatus
-        with pytest.raises(ValueError):
-            NotificationStatus("invalid")
-
-    def test_notification_status_iteration(self):
-        """Test iterating over NotificationStatus."""
-        statuses = list(NotificationStatus)
-        assert len(statuses) == 3
-        assert NotificationStatus.PENDING in statuses
-        assert NotificationStatus.SENT in statuses
-        assert NotificationStatus.FAILED in statuses
+    def test_terminal_statuses(self):
+        """Test that only processed statuses are terminal."""
+        assert TERMINAL_STATUSES == {
+            NotificationStatus.SENT,
+            NotificationStatus.FAILED,
+        }
+        assert NotificationStatus.PENDING not in TERMINAL_STATUSES